@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections import deque
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -15,6 +14,7 @@ from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import ActorContext, require_admin_or_agent, require_org_member
+from app.core.jsonio import json_dumps
 from app.core.time import utcnow
 from app.db.pagination import paginate
 from app.db.session import async_session_maker, get_session
@@ -208,7 +208,8 @@ async def list_task_comment_feed(
     )
     board_ids = await list_accessible_board_ids(session, member=ctx.member, write=False)
     if board_id is not None:
-        if board_id not in set(board_ids):
+        # A single membership test doesn't amortize building a set first.
+        if board_id not in board_ids:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
         statement = statement.where(col(Task.board_id) == board_id)
     elif board_ids:
@@ -279,7 +280,7 @@ async def stream_task_comment_feed(
                         agent,
                     ).model_dump(mode="json"),
                 }
-                yield {"event": "comment", "data": json.dumps(payload)}
+                yield {"event": "comment", "data": json_dumps(payload)}
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -20,6 +19,7 @@ from app.api.deps import (
     get_board_for_user_write,
     require_admin_or_agent,
 )
+from app.core.jsonio import json_dumps
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.pagination import paginate
@@ -380,7 +380,7 @@ async def stream_approvals(
                     payload["task_counts"] = task_counts[0]
                 elif task_counts:
                     payload["task_counts"] = task_counts
-                yield {"event": "approval", "data": json.dumps(payload)}
+                yield {"event": "approval", "data": json_dumps(payload)}
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
@@ -43,6 +43,8 @@ from app.services.organizations import (
 )
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -225,19 +227,28 @@ async def _agents_for_group_heartbeat(
     return board_by_id, agents
 
 
+# Loop-invariant for the per-agent heartbeat updates below.
+_HEARTBEAT_TARGET = DEFAULT_HEARTBEAT_CONFIG.get("target", "last")
+
+
 def _update_agent_heartbeat(
     *,
     agent: Agent,
     payload: BoardGroupHeartbeatApply,
-) -> None:
+    now: datetime,
+) -> bool:
+    """Apply the requested heartbeat config; return whether the agent changed."""
     raw = agent.heartbeat_config
     heartbeat: dict[str, Any] = DEFAULT_HEARTBEAT_CONFIG.copy()
     if isinstance(raw, dict):
         heartbeat.update(raw)
     heartbeat["every"] = payload.every
-    heartbeat["target"] = DEFAULT_HEARTBEAT_CONFIG.get("target", "last")
+    heartbeat["target"] = _HEARTBEAT_TARGET
+    if heartbeat == raw:
+        return False
     agent.heartbeat_config = heartbeat
-    agent.updated_at = utcnow()
+    agent.updated_at = now
+    return True
 
 
 async def _sync_gateway_heartbeats(
@@ -256,6 +267,11 @@ async def _sync_gateway_heartbeats(
             continue
         agents_by_gateway_id.setdefault(board.gateway_id, []).append(agent)
 
+    if not agents_by_gateway_id:
+        # No agent resolved to a gateway-backed board; skip the gateway
+        # lookup and sync round trips entirely.
+        return []
+
     failed_agent_ids: list[UUID] = []
     gateway_ids = list(agents_by_gateway_id.keys())
     gateways = await Gateway.objects.by_ids(gateway_ids).all(session)
@@ -306,17 +322,24 @@ async def apply_board_group_heartbeat(
         )
 
     updated_agent_ids: list[UUID] = []
+    changed_agents: list[Agent] = []
+    now = utcnow()
     for agent in agents:
-        _update_agent_heartbeat(agent=agent, payload=payload)
-        session.add(agent)
+        if _update_agent_heartbeat(agent=agent, payload=payload, now=now):
+            session.add(agent)
+            changed_agents.append(agent)
         updated_agent_ids.append(agent.id)
 
-    await session.commit()
-    failed_agent_ids = await _sync_gateway_heartbeats(
-        session,
-        board_by_id=board_by_id,
-        agents=agents,
-    )
+    failed_agent_ids: list[UUID] = []
+    if changed_agents:
+        # Steady-state re-applies change nothing; skip the commit and the
+        # gateway config round trips instead of pushing an identical payload.
+        await session.commit()
+        failed_agent_ids = await _sync_gateway_heartbeats(
+            session,
+            board_by_id=board_by_id,
+            agents=changed_agents,
+        )
 
     return BoardGroupHeartbeatApplyResult(
         board_group_id=group_id,
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -20,6 +19,7 @@ from app.api.deps import (
     require_admin_or_agent,
 )
 from app.core.config import settings
+from app.core.jsonio import json_dumps
 from app.core.time import utcnow
 from app.db.pagination import paginate
 from app.db.session import async_session_maker, get_session
@@ -265,7 +265,7 @@ async def stream_board_memory(
             for memory in memories:
                 last_seen = max(memory.created_at, last_seen)
                 payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
+                yield {"event": "memory", "data": json_dumps(payload)}
             await asyncio.sleep(STREAM_POLL_SECONDS)
 
     return EventSourceResponse(event_generator(), ping=15)
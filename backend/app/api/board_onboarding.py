@@ -387,7 +387,8 @@ async def agent_onboarding_update(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT)
 
     messages = list(onboarding.messages or [])
-    now = utcnow().isoformat()
+    now_dt = utcnow()
+    now = now_dt.isoformat()
     payload_text = payload.model_dump_json(exclude_none=True)
     payload_data = payload.model_dump(mode="json", exclude_none=True)
     logger.info(
@@ -408,7 +409,7 @@ async def agent_onboarding_update(
         )
 
     onboarding.messages = messages
-    onboarding.updated_at = utcnow()
+    onboarding.updated_at = now_dt
     session.add(onboarding)
     await session.commit()
     await session.refresh(onboarding)
@@ -154,12 +154,6 @@ async def _apply_board_update(
     board: Board,
 ) -> Board:
     updates = payload.model_dump(exclude_unset=True)
-    if "gateway_id" in updates:
-        await _require_gateway(
-            session,
-            updates["gateway_id"],
-            organization_id=board.organization_id,
-        )
     if "board_group_id" in updates and updates["board_group_id"] is not None:
         await _require_board_group(
             session,
@@ -176,8 +170,13 @@ async def _apply_board_update(
     if not board.gateway_id:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail="gateway_id is required",
+            detail=(
+                "gateway_id is invalid" if "gateway_id" in updates else "gateway_id is required"
+            ),
         )
+    # A single post-apply check validates both an incoming gateway_id and the
+    # stored one; the pre-apply _require_gateway call re-ran the same two
+    # SELECTs for the same id.
     await _require_gateway(
         session,
         board.gateway_id,
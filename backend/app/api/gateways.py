@@ -71,6 +71,15 @@ def _template_sync_query(
 SYNC_QUERY_DEP = Depends(_template_sync_query)
 
 
+def _admin_service(
+    session: AsyncSession = SESSION_DEP,
+) -> GatewayAdminLifecycleService:
+    return GatewayAdminLifecycleService(session)
+
+
+ADMIN_SERVICE_DEP = Depends(_admin_service)
+
+
 @router.get("", response_model=DefaultLimitOffsetPage[GatewayRead])
 async def list_gateways(
     session: AsyncSession = SESSION_DEP,
@@ -91,9 +100,9 @@ async def create_gateway(
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
+    service: GatewayAdminLifecycleService = ADMIN_SERVICE_DEP,
 ) -> Gateway:
     """Create a gateway and provision or refresh its main agent."""
-    service = GatewayAdminLifecycleService(session)
     await service.assert_gateway_runtime_compatible(
         url=payload.url,
         token=payload.token,
@@ -112,11 +121,10 @@ async def create_gateway(
 @router.get("/{gateway_id}", response_model=GatewayRead)
 async def get_gateway(
     gateway_id: UUID,
-    session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
+    service: GatewayAdminLifecycleService = ADMIN_SERVICE_DEP,
 ) -> Gateway:
     """Return one gateway by id for the caller's organization."""
-    service = GatewayAdminLifecycleService(session)
     gateway = await service.require_gateway(
         gateway_id=gateway_id,
         organization_id=ctx.organization.id,
@@ -131,14 +139,17 @@ async def update_gateway(
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
+    service: GatewayAdminLifecycleService = ADMIN_SERVICE_DEP,
 ) -> Gateway:
     """Patch a gateway and refresh the main-agent provisioning state."""
-    service = GatewayAdminLifecycleService(session)
     gateway = await service.require_gateway(
         gateway_id=gateway_id,
         organization_id=ctx.organization.id,
     )
     updates = payload.model_dump(exclude_unset=True)
+    if not updates:
+        # No fields were sent; skip the patch and the main-agent reprovision.
+        return gateway
     if (
         "url" in updates
         or "token" in updates
@@ -170,12 +181,11 @@ async def update_gateway(
 async def sync_gateway_templates(
     gateway_id: UUID,
     sync_query: GatewayTemplateSyncQuery = SYNC_QUERY_DEP,
-    session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
+    service: GatewayAdminLifecycleService = ADMIN_SERVICE_DEP,
 ) -> GatewayTemplatesSyncResult:
     """Sync templates for a gateway and optionally rotate runtime settings."""
-    service = GatewayAdminLifecycleService(session)
     gateway = await service.require_gateway(
         gateway_id=gateway_id,
         organization_id=ctx.organization.id,
@@ -188,26 +198,21 @@ async def delete_gateway(
     gateway_id: UUID,
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
+    service: GatewayAdminLifecycleService = ADMIN_SERVICE_DEP,
 ) -> OkResponse:
     """Delete a gateway in the caller's organization."""
-    service = GatewayAdminLifecycleService(session)
     gateway = await service.require_gateway(
         gateway_id=gateway_id,
         organization_id=ctx.organization.id,
     )
-    main_agent = await service.find_main_agent(gateway)
-    if main_agent is not None:
-        await service.clear_agent_foreign_keys(agent_id=main_agent.id)
-        await session.delete(main_agent)
-
-    duplicate_main_agents = await Agent.objects.filter_by(
+    # One fetch covers the main agent and any duplicates: both queries used
+    # the same (gateway_id, board_id IS NULL) predicate.
+    main_agents = await Agent.objects.filter_by(
         gateway_id=gateway.id,
         board_id=None,
     ).all(session)
-    for agent in duplicate_main_agents:
-        if main_agent is not None and agent.id == main_agent.id:
-            continue
-        await service.clear_agent_foreign_keys(agent_id=agent.id)
+    await service.clear_agents_foreign_keys(agent_ids=[agent.id for agent in main_agents])
+    for agent in main_agents:
         await session.delete(agent)
 
     # NOTE: The migration declares `ondelete="CASCADE"` for gateway_installed_skills.gateway_id,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from uuid import UUID
@@ -284,12 +285,13 @@ async def _query_wip(
     )
     status_results = (await session.exec(status_statement)).all()
 
-    mapping: dict[datetime, dict[str, int]] = {}
+    # defaultdict materializes each bucket's inner dict on first access,
+    # avoiding a setdefault (hash + empty-dict allocation) per result row.
+    mapping: defaultdict[datetime, dict[str, int]] = defaultdict(dict)
     for bucket, inbox in inbox_results:
-        values = mapping.setdefault(bucket, {})
-        values["inbox"] = int(inbox or 0)
+        mapping[bucket]["inbox"] = int(inbox or 0)
     for bucket, in_progress, review, done in status_results:
-        values = mapping.setdefault(bucket, {})
+        values = mapping[bucket]
         values["in_progress"] = int(in_progress or 0)
         values["review"] = int(review or 0)
         values["done"] = int(done or 0)
@@ -9,7 +9,7 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Iterator, TextIO
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO
 from urllib.parse import unquote, urlparse
 from uuid import UUID
 
@@ -105,12 +105,9 @@ def _infer_skill_description(skill_file: Path) -> str | None:
     except OSError:
         return None
 
-    lines = [line.strip() for line in content.splitlines()]
-    if not lines:
-        return None
-
     in_frontmatter = False
-    for line in lines:
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
         if line == "---":
             in_frontmatter = not in_frontmatter
             continue
@@ -132,6 +129,10 @@ def _infer_skill_display_name(skill_file: Path, fallback: str) -> str:
     except OSError:
         content = ""
 
+    # Single pass: a frontmatter name wins outright, otherwise the first
+    # markdown heading is remembered as the fallback instead of re-scanning
+    # and re-stripping every line in a second loop.
+    first_heading: str | None = None
     in_frontmatter = False
     for raw_line in content.splitlines():
         line = raw_line.strip()
@@ -142,13 +143,13 @@ def _infer_skill_display_name(skill_file: Path, fallback: str) -> str:
             value = line.split(":", maxsplit=1)[-1].strip().strip("\"'")
             if value:
                 return value
-
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-        if line.startswith("#"):
+        if first_heading is None and line.startswith("#"):
             heading = line.lstrip("#").strip()
             if heading:
-                return heading
+                first_heading = heading
+
+    if first_heading is not None:
+        return first_heading
 
     normalized_fallback = fallback.replace("-", " ").replace("_", " ").strip()
     return normalized_fallback or "Skill"
@@ -231,10 +232,10 @@ def _repo_base_from_tree_source_url(source_url: str) -> str | None:
     return _normalize_repo_source_url(f"{parsed.scheme}://{parsed.netloc}{repo_path}")
 
 
-def _build_skill_count_by_repo(skills: list[MarketplaceSkill]) -> dict[str, int]:
+def _build_skill_count_by_repo(source_urls: Iterable[str]) -> dict[str, int]:
     counts: dict[str, int] = {}
-    for skill in skills:
-        repo_base = _repo_base_from_tree_source_url(skill.source_url)
+    for source_url in source_urls:
+        repo_base = _repo_base_from_tree_source_url(source_url)
         if repo_base is None:
             continue
         counts[repo_base] = counts.get(repo_base, 0) + 1
@@ -824,8 +825,14 @@ async def _load_pack_skill_count_by_repo(
     session: AsyncSession,
     organization_id: UUID,
 ) -> dict[str, int]:
-    skills = await MarketplaceSkill.objects.filter_by(organization_id=organization_id).all(session)
-    return _build_skill_count_by_repo(skills)
+    # Only source_url feeds the counts; skip fetching descriptions and
+    # metadata JSON for every skill row.
+    source_urls = await session.exec(
+        select(col(MarketplaceSkill.source_url)).where(
+            col(MarketplaceSkill.organization_id) == organization_id,
+        ),
+    )
+    return _build_skill_count_by_repo(source_urls)
 
 
 def _as_skill_pack_read_with_count(
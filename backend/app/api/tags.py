@@ -7,6 +7,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import col, select
 
 from app.api.deps import require_org_admin, require_org_member
@@ -16,7 +17,7 @@ from app.db.pagination import paginate
 from app.db.session import get_session
 from app.models.tag_assignments import TagAssignment
 from app.models.tags import Tag
-from app.schemas.common import OkResponse
+from app.schemas.common import OkResponse, construct_trusted
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.tags import TagCreate, TagRead, TagUpdate
 from app.services.organizations import OrganizationContext
@@ -53,24 +54,7 @@ async def _require_org_tag(
     return tag
 
 
-async def _ensure_slug_available(
-    session: AsyncSession,
-    *,
-    organization_id: UUID,
-    slug: str,
-    exclude_tag_id: UUID | None = None,
-) -> None:
-    existing = await Tag.objects.filter_by(organization_id=organization_id, slug=slug).first(
-        session
-    )
-    if existing is None:
-        return
-    if exclude_tag_id is not None and existing.id == exclude_tag_id:
-        return
-    raise HTTPException(
-        status_code=status.HTTP_409_CONFLICT,
-        detail="Tag slug already exists in this organization.",
-    )
+_SLUG_CONFLICT_DETAIL = "Tag slug already exists in this organization."
 
 
 async def _tag_read_page(
@@ -84,12 +68,7 @@ async def _tag_read_page(
         session,
         tag_ids=[item.id for item in items],
     )
-    return [
-        TagRead.model_validate(item, from_attributes=True).model_copy(
-            update={"task_count": counts.get(item.id, 0)},
-        )
-        for item in items
-    ]
+    return [construct_trusted(TagRead, item, task_count=counts.get(item.id, 0)) for item in items]
 
 
 @router.get("", response_model=DefaultLimitOffsetPage[TagRead])
@@ -124,20 +103,25 @@ async def create_tag(
 ) -> TagRead:
     """Create a tag within the active organization."""
     slug = _normalize_slug(payload.slug, fallback_name=payload.name)
-    await _ensure_slug_available(
-        session,
-        organization_id=ctx.organization.id,
-        slug=slug,
-    )
-    tag = await crud.create(
-        session,
-        Tag,
-        organization_id=ctx.organization.id,
-        name=payload.name,
-        slug=slug,
-        color=payload.color,
-        description=payload.description,
-    )
+    # No duplicate pre-check: uq_tags_organization_id_slug enforces uniqueness
+    # and the happy path saves a SELECT per create.
+    try:
+        tag = await crud.create(
+            session,
+            Tag,
+            organization_id=ctx.organization.id,
+            name=payload.name,
+            slug=slug,
+            color=payload.color,
+            description=payload.description,
+        )
+    except IntegrityError as err:
+        if not crud.is_unique_violation(err):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=_SLUG_CONFLICT_DETAIL,
+        ) from err
     return TagRead.model_validate(tag, from_attributes=True)
 
 
@@ -185,15 +169,16 @@ async def update_tag(
             updates.get("slug"),
             fallback_name=str(updates.get("name") or tag.name),
         )
-    if "slug" in updates and isinstance(updates["slug"], str):
-        await _ensure_slug_available(
-            session,
-            organization_id=ctx.organization.id,
-            slug=updates["slug"],
-            exclude_tag_id=tag.id,
-        )
     updates["updated_at"] = utcnow()
-    updated = await crud.patch(session, tag, updates)
+    try:
+        updated = await crud.patch(session, tag, updates)
+    except IntegrityError as err:
+        if not crud.is_unique_violation(err):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=_SLUG_CONFLICT_DETAIL,
+        ) from err
     return TagRead.model_validate(updated, from_attributes=True)
 
 
@@ -12,6 +12,7 @@ from sqlmodel import col, select
 
 from app.api.deps import require_org_admin, require_org_member
 from app.core.time import utcnow
+from app.db import crud
 from app.db.session import get_session
 from app.models.boards import Board
 from app.models.task_custom_fields import (
@@ -70,8 +71,10 @@ async def _board_ids_by_definition_id(
     }
     for definition_id, board_id in rows:
         board_ids_by_definition_id.setdefault(definition_id, []).append(board_id)
-    for definition_id in board_ids_by_definition_id:
-        board_ids_by_definition_id[definition_id].sort(key=str)
+    for board_ids in board_ids_by_definition_id.values():
+        # UUID ordering matches canonical string ordering; sort the objects
+        # directly instead of building a str per id.
+        board_ids.sort()
     return board_ids_by_definition_id
 
 
@@ -98,8 +101,7 @@ async def _validated_board_ids_for_org(
         ).all(),
     )
     missing_board_ids = sorted(
-        {board_id for board_id in normalized_board_ids if board_id not in valid_board_ids},
-        key=str,
+        board_id for board_id in normalized_board_ids if board_id not in valid_board_ids
     )
     if missing_board_ids:
         raise HTTPException(
@@ -193,17 +195,19 @@ async def create_org_custom_field(
     )
     session.add(definition)
     await session.flush()
-    for board_id in board_ids:
-        session.add(
-            BoardTaskCustomField(
-                board_id=board_id,
-                task_custom_field_definition_id=definition.id,
-            ),
+    session.add_all(
+        BoardTaskCustomField(
+            board_id=board_id,
+            task_custom_field_definition_id=definition.id,
         )
+        for board_id in board_ids
+    )
     try:
         await session.commit()
     except IntegrityError as err:
         await session.rollback()
+        if not crud.is_unique_violation(err):
+            raise
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Field key already exists in this organization.",
@@ -270,15 +274,14 @@ async def update_org_custom_field(
         for binding in bindings:
             if binding.board_id not in target_board_ids:
                 await session.delete(binding)
-        for board_id in validated_board_ids:
-            if board_id in current_board_ids:
-                continue
-            session.add(
-                BoardTaskCustomField(
-                    board_id=board_id,
-                    task_custom_field_definition_id=definition.id,
-                ),
+        session.add_all(
+            BoardTaskCustomField(
+                board_id=board_id,
+                task_custom_field_definition_id=definition.id,
             )
+            for board_id in validated_board_ids
+            if board_id not in current_board_ids
+        )
     definition.updated_at = utcnow()
     session.add(definition)
 
@@ -286,6 +289,8 @@ async def update_org_custom_field(
         await session.commit()
     except IntegrityError as err:
         await session.rollback()
+        if not crud.is_unique_violation(err):
+            raise
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Field key already exists in this organization.",
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -23,6 +22,7 @@ from app.api.deps import (
     require_admin_auth,
     require_admin_or_agent,
 )
+from app.core.jsonio import json_dumps
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
@@ -1216,7 +1216,7 @@ async def _task_event_generator(
                 tag_state_by_task_id=tag_state_by_task_id,
                 custom_field_values_by_task_id=custom_field_values_by_task_id,
             )
-            yield {"event": "task", "data": json.dumps(payload)}
+            yield {"event": "task", "data": json_dumps(payload)}
         await asyncio.sleep(2)
 
 
@@ -0,0 +1,38 @@
+"""Fast JSON encode/decode helpers with a stdlib fallback.
+
+`orjson` parses and serializes large payloads several times faster than the
+stdlib, which matters for gateway RPC frames carrying whole config documents.
+It is used opportunistically so environments without the wheel (it is not part
+of the locked dependency set) keep working on stdlib `json`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - exercised implicitly by whichever branch is installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+
+    def json_loads(data: str | bytes) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Encode an object as a compact JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+
+    def json_loads(data: str | bytes) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Encode an object as a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
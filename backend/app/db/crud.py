@@ -30,6 +30,21 @@ DoesNotExist = DoesNotExistError
 MultipleObjectsReturned = MultipleObjectsReturnedError
 
 
+def is_unique_violation(exc: IntegrityError) -> bool:
+    """Return whether an IntegrityError stems from a unique constraint.
+
+    Inspects the driver-level message via ``exc.orig.args`` instead of
+    ``str(exc)``, which would format the full statement and parameters just
+    to run a substring search.
+    """
+    args = getattr(getattr(exc, "orig", exc), "args", ())
+    first = args[0] if args and isinstance(args[0], str) else ""
+    lowered = first.lower()
+    # sqlite: "UNIQUE constraint failed: ..."; postgres: "duplicate key value
+    # violates unique constraint ...".
+    return "unique" in lowered or "duplicate key" in lowered
+
+
 async def _flush_or_rollback(session: AsyncSession) -> None:
     """Flush changes and rollback on SQLAlchemy errors."""
     try:
@@ -243,6 +258,9 @@ async def update_where(
     return int(rowcount) if isinstance(rowcount, int) else 0
 
 
+_UNSET = object()
+
+
 def apply_updates(
     obj: ModelT,
     updates: Mapping[str, Any],
@@ -256,7 +274,10 @@ def apply_updates(
             continue
         if exclude_none and value is None:
             continue
-        setattr(obj, key, value)
+        # Skip no-op assignments so unchanged columns (notably large JSON
+        # payloads) are not marked dirty and re-written at flush time.
+        if getattr(obj, key, _UNSET) != value:
+            setattr(obj, key, value)
     return obj
 
 
@@ -14,6 +14,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import models as _models
 from app.core.config import settings
+from app.core.jsonio import json_dumps, json_loads
 from app.core.logging import get_logger
 
 if TYPE_CHECKING:
@@ -35,6 +36,10 @@ def _normalize_database_url(database_url: str) -> str:
 async_engine: AsyncEngine = create_async_engine(
     _normalize_database_url(settings.database_url),
     pool_pre_ping=True,
+    # JSON/JSONB columns (heartbeat_config, identity_profile, payloads) decode
+    # and encode through the fast codec instead of stdlib json.
+    json_serializer=json_dumps,
+    json_deserializer=json_loads,
 )
 async_session_maker = async_sessionmaker(
     async_engine,
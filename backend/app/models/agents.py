@@ -7,6 +7,7 @@ from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy import JSON, Column, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field
 
 from app.core.time import utcnow
@@ -14,6 +15,10 @@ from app.models.base import QueryModel
 
 RUNTIME_ANNOTATION_TYPES = (datetime,)
 
+# JSONB on PostgreSQL (binary storage, operator/index support); plain JSON on
+# other backends such as the SQLite test databases.
+_JSON_VARIANT = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Agent(QueryModel, table=True):
     """Agent configuration and lifecycle state persisted in the database."""
@@ -29,11 +34,11 @@ class Agent(QueryModel, table=True):
     agent_token_hash: str | None = Field(default=None, index=True)
     heartbeat_config: dict[str, Any] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(_JSON_VARIANT),
     )
     identity_profile: dict[str, Any] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(_JSON_VARIANT),
     )
     identity_template: str | None = Field(default=None, sa_column=Column(Text))
     soul_template: str | None = Field(default=None, sa_column=Column(Text))
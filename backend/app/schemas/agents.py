@@ -7,29 +7,56 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, model_validator
 from sqlmodel import SQLModel
 from sqlmodel._compat import SQLModelConfig
 
-from app.schemas.common import NonEmptyStr
+from app.schemas.common import NonEmptyStr, construct_trusted
 
 _RUNTIME_TYPE_REFERENCES = (datetime, UUID, NonEmptyStr)
 
 
+def _normalize_template(value: object) -> object | None:
+    """Normalize blank template text to null."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def _is_normalized_profile(profile: dict[Any, Any]) -> bool:
+    """Probe whether a profile dict is already in canonical form."""
+    for key, value in profile.items():
+        if type(key) is not str or type(value) is not str:
+            return False
+        if not key or not value:
+            return False
+        if key[0].isspace() or key[-1].isspace() or value[0].isspace() or value[-1].isspace():
+            return False
+    return True
+
+
 def _normalize_identity_profile(
     profile: object,
 ) -> dict[str, str] | None:
     if not isinstance(profile, Mapping):
         return None
+    # Heartbeats usually re-send the profile unchanged; skip the rebuild when
+    # every key/value is already a trimmed non-empty string.
+    if type(profile) is dict and profile and _is_normalized_profile(profile):
+        return profile
     normalized: dict[str, str] = {}
     for raw_key, raw in profile.items():
         if raw is None:
             continue
-        key = str(raw_key).strip()
+        # Keys are almost always str already; skip the str() round-trip then.
+        key = raw_key.strip() if type(raw_key) is str else str(raw_key).strip()
         if not key:
             continue
         if isinstance(raw, list):
-            parts = [str(item).strip() for item in raw if str(item).strip()]
+            parts = [part for item in raw if (part := str(item).strip())]
             if not parts:
                 continue
             normalized[key] = ", ".join(parts)
@@ -40,6 +67,29 @@ def _normalize_identity_profile(
     return normalized or None
 
 
+_NORMALIZED_TEMPLATE_KEYS = ("identity_template", "soul_template")
+
+
+def _normalize_agent_payload(data: object) -> object:
+    """Normalize template and identity-profile values in one pass.
+
+    Shared by the before-model validators on ``AgentBase`` and
+    ``AgentUpdate`` so each validation pays a single Python callback
+    instead of one per normalized field.
+    """
+    if not isinstance(data, dict):
+        return data
+    if "identity_profile" not in data and not any(key in data for key in _NORMALIZED_TEMPLATE_KEYS):
+        return data
+    data = dict(data)
+    for key in _NORMALIZED_TEMPLATE_KEYS:
+        if key in data:
+            data[key] = _normalize_template(data[key])
+    if "identity_profile" in data:
+        data["identity_profile"] = _normalize_identity_profile(data["identity_profile"])
+    return data
+
+
 class AgentBase(SQLModel):
     """Common fields shared by agent create/read/update payloads."""
 
@@ -102,25 +152,10 @@ class AgentBase(SQLModel):
         examples=["When critical blockers appear, escalate in plain language."],
     )
 
-    @field_validator("identity_template", "soul_template", mode="before")
-    @classmethod
-    def normalize_templates(cls, value: object) -> object | None:
-        """Normalize blank template text to null."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            value = value.strip()
-            return value or None
-        return value
-
-    @field_validator("identity_profile", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def normalize_identity_profile(
-        cls,
-        value: object,
-    ) -> dict[str, str] | None:
-        """Normalize identity-profile values into trimmed string mappings."""
-        return _normalize_identity_profile(value)
+    def _normalize_payload(cls, data: object) -> object:
+        return _normalize_agent_payload(data)
 
 
 class AgentCreate(AgentBase):
@@ -191,25 +226,10 @@ class AgentUpdate(SQLModel):
         examples=["Escalate only after checking all known mitigations."],
     )
 
-    @field_validator("identity_template", "soul_template", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def normalize_templates(cls, value: object) -> object | None:
-        """Normalize blank template text to null."""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            value = value.strip()
-            return value or None
-        return value
-
-    @field_validator("identity_profile", mode="before")
-    @classmethod
-    def normalize_identity_profile(
-        cls,
-        value: object,
-    ) -> dict[str, str] | None:
-        """Normalize identity-profile values into trimmed string mappings."""
-        return _normalize_identity_profile(value)
+    def _normalize_payload(cls, data: object) -> object:
+        return _normalize_agent_payload(data)
 
 
 class AgentRead(AgentBase):
@@ -248,6 +268,26 @@ class AgentRead(AgentBase):
     created_at: datetime = Field(description="Creation timestamp.")
     updated_at: datetime = Field(description="Last update timestamp.")
 
+    @classmethod
+    def from_orm_trusted(cls, obj: object, **overrides: object) -> AgentRead:
+        """Build a read model from a trusted DB row without re-validation.
+
+        DB rows already hold typed, normalized values, so the full validator
+        pass (UUID parsing, template/profile normalization) is skipped.
+        Untrusted input must keep going through ``model_validate``.
+        """
+        return construct_trusted(cls, obj, **overrides)
+
+
+# Cached adapter for agent event frames so stream serialization reuses one
+# compiled SchemaSerializer instead of model_dump + json.dumps per event.
+_AGENT_EVENT_TA: TypeAdapter[dict[str, AgentRead]] = TypeAdapter(dict[str, AgentRead])
+
+
+def dump_agent_event(payload: dict[str, AgentRead]) -> str:
+    """Serialize an agent event payload straight to a JSON string."""
+    return _AGENT_EVENT_TA.dump_json(payload).decode("utf-8")
+
 
 class AgentHeartbeat(SQLModel):
     """Heartbeat status payload sent by agents."""
@@ -314,3 +354,11 @@ class AgentNudge(SQLModel):
         description="Short message to direct an agent toward immediate attention.",
         examples=["Please update the incident triage status for task T-001."],
     )
+
+
+# Build the core schemas eagerly so the first API request does not pay the
+# lazy parent-namespace resolution and validator-construction cost.
+AgentBase.model_rebuild(force=True)
+AgentCreate.model_rebuild(force=True)
+AgentUpdate.model_rebuild(force=True)
+AgentRead.model_rebuild(force=True)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, TypeVar, cast
 
 from pydantic import StringConstraints
 from sqlmodel import SQLModel
@@ -11,6 +11,23 @@ from sqlmodel import SQLModel
 # are invalid.
 NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
+ReadModelT = TypeVar("ReadModelT", bound=SQLModel)
+
+
+def construct_trusted(
+    model: type[ReadModelT],
+    obj: object,
+    **overrides: object,
+) -> ReadModelT:
+    """Build a read model from a trusted DB row without re-validation.
+
+    DB rows already hold typed, normalized values, so the validator pass is
+    skipped. Untrusted input must keep going through ``model_validate``.
+    """
+    data = {name: getattr(obj, name) for name in model.model_fields if hasattr(obj, name)}
+    data.update(overrides)
+    return cast(ReadModelT, model.model_construct(**data))
+
 
 class OkResponse(SQLModel):
     """Standard success response payload."""
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from itertools import chain
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -19,16 +22,33 @@ if TYPE_CHECKING:
 TASK_ID_KEYS: tuple[str, ...] = ("task_id", "taskId", "taskID")
 TASK_IDS_KEYS: tuple[str, ...] = ("task_ids", "taskIds", "taskIDs")
 
+_CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid_str(value: str) -> UUID | None:
+    # Approval payloads repeat the same task ids across syncs; memoize the
+    # parse so repeat encounters skip the UUID constructor entirely.
+    # Canonical dashed strings (the overwhelmingly common case) parse without
+    # the try/except; junk strings fail the regex instead of raising.
+    if _CANONICAL_UUID_RE.match(value):
+        return UUID(value)
+    try:
+        # Rare alternate encodings UUID() accepts: urn prefix, braces, bare hex.
+        return UUID(value)
+    except ValueError:
+        return None
+
 
 def _coerce_uuid(value: object) -> UUID | None:
     if isinstance(value, UUID):
         return value
-    if isinstance(value, str):
-        try:
-            return UUID(value)
-        except ValueError:
-            return None
-    return None
+    if not isinstance(value, str):
+        return None
+    return _parse_uuid_str(value)
 
 
 def extract_task_ids(payload: dict[str, object] | None) -> list[UUID]:
@@ -36,27 +56,25 @@ def extract_task_ids(payload: dict[str, object] | None) -> list[UUID]:
     if not payload:
         return []
 
+    # Dedupe while collecting (one hash lookup per id) instead of building an
+    # intermediate list and re-walking it with dict.fromkeys.
+    seen: set[UUID] = set()
     collected: list[UUID] = []
     for key in TASK_IDS_KEYS:
         raw = payload.get(key)
         if isinstance(raw, Sequence) and not isinstance(raw, (str, bytes, bytearray)):
             for item in raw:
                 task_id = _coerce_uuid(item)
-                if task_id is not None:
+                if task_id is not None and task_id not in seen:
+                    seen.add(task_id)
                     collected.append(task_id)
     for key in TASK_ID_KEYS:
         task_id = _coerce_uuid(payload.get(key))
-        if task_id is not None:
+        if task_id is not None and task_id not in seen:
+            seen.add(task_id)
             collected.append(task_id)
 
-    deduped: list[UUID] = []
-    seen: set[UUID] = set()
-    for task_id in collected:
-        if task_id in seen:
-            continue
-        seen.add(task_id)
-        deduped.append(task_id)
-    return deduped
+    return collected
 
 
 def normalize_task_ids(
@@ -66,20 +84,10 @@ def normalize_task_ids(
     payload: dict[str, object] | None,
 ) -> list[UUID]:
     """Merge explicit and payload-provided task references into an ordered unique list."""
-    merged: list[UUID] = []
-    merged.extend(task_ids)
-    if task_id is not None:
-        merged.append(task_id)
-    merged.extend(extract_task_ids(payload))
-
-    deduped: list[UUID] = []
-    seen: set[UUID] = set()
-    for value in merged:
-        if value in seen:
-            continue
-        seen.add(value)
-        deduped.append(value)
-    return deduped
+    # Feed all three sources straight into the dedup dict; no intermediate
+    # merged list to build and re-walk.
+    explicit = (task_id,) if task_id is not None else ()
+    return list(dict.fromkeys(chain(task_ids, explicit, extract_task_ids(payload))))
 
 
 async def load_task_ids_by_approval(
@@ -92,12 +100,10 @@ async def load_task_ids_by_approval(
     if not ids:
         return {}
 
-    rows = list(
-        await session.exec(
-            select(col(ApprovalTaskLink.approval_id), col(ApprovalTaskLink.task_id))
-            .where(col(ApprovalTaskLink.approval_id).in_(ids))
-            .order_by(col(ApprovalTaskLink.created_at).asc()),
-        ),
+    rows = await session.exec(
+        select(col(ApprovalTaskLink.approval_id), col(ApprovalTaskLink.task_id))
+        .where(col(ApprovalTaskLink.approval_id).in_(ids))
+        .order_by(col(ApprovalTaskLink.created_at).asc()),
     )
 
     mapping: dict[UUID, list[UUID]] = {approval_id: [] for approval_id in ids}
@@ -118,8 +124,9 @@ async def replace_approval_task_links(
             col(ApprovalTaskLink.approval_id) == approval_id,
         ),
     )
-    for task_id in task_ids:
-        session.add(ApprovalTaskLink(approval_id=approval_id, task_id=task_id))
+    session.add_all(
+        ApprovalTaskLink(approval_id=approval_id, task_id=task_id) for task_id in task_ids
+    )
 
 
 async def lock_tasks_for_approval(
@@ -128,7 +135,9 @@ async def lock_tasks_for_approval(
     task_ids: Sequence[UUID],
 ) -> None:
     """Acquire row locks for task ids in deterministic order within a transaction."""
-    normalized_task_ids = sorted({*task_ids}, key=str)
+    # UUIDs order by their 128-bit value, which matches the canonical string
+    # order exactly, so sorting them directly skips a str() per id.
+    normalized_task_ids = sorted({*task_ids})
     if not normalized_task_ids:
         return
     statement = (
@@ -167,7 +176,7 @@ async def pending_approval_conflicts_by_task(
     )
     if exclude_approval_id is not None:
         linked_statement = linked_statement.where(col(Approval.id) != exclude_approval_id)
-    linked_rows = list(await session.exec(linked_statement))
+    linked_rows = await session.exec(linked_statement)
 
     conflicts: dict[UUID, UUID] = {}
     for task_id, approval_id, _created_at in linked_rows:
@@ -194,7 +203,7 @@ async def pending_approval_conflicts_by_task(
     )
     if exclude_approval_id is not None:
         legacy_statement = legacy_statement.where(col(Approval.id) != exclude_approval_id)
-    legacy_rows = list(await session.exec(legacy_statement))
+    legacy_rows = await session.exec(legacy_statement)
 
     for legacy_task_id_opt, approval_id, _created_at in legacy_rows:
         if legacy_task_id_opt is None:
@@ -234,7 +243,7 @@ async def task_counts_for_board(
     link_statement = link_statement.group_by(col(ApprovalTaskLink.task_id))
 
     counts: dict[UUID, tuple[int, int]] = {}
-    for task_id, total, pending in list(await session.exec(link_statement)):
+    for task_id, total, pending in await session.exec(link_statement):
         counts[task_id] = (int(total or 0), int(pending or 0))
 
     # Backward compatibility: include legacy rows that have task_id set but no link rows.
@@ -263,7 +272,7 @@ async def task_counts_for_board(
         legacy_statement = legacy_statement.where(col(Approval.task_id).in_(task_ids))
     legacy_statement = legacy_statement.group_by(col(Approval.task_id))
 
-    for legacy_task_id, total, pending in list(await session.exec(legacy_statement)):
+    for legacy_task_id, total, pending in await session.exec(legacy_statement):
         if legacy_task_id is None:
             continue
         previous = counts.get(legacy_task_id, (0, 0))
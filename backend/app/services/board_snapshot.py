@@ -14,6 +14,7 @@ from app.models.tasks import Task
 from app.schemas.approvals import ApprovalRead
 from app.schemas.board_memory import BoardMemoryRead
 from app.schemas.boards import BoardRead
+from app.schemas.common import construct_trusted
 from app.schemas.view_models import BoardSnapshot, TaskCardRead
 from app.services.approval_task_links import load_task_ids_by_approval, task_counts_for_board
 from app.services.openclaw.provisioning_db import AgentLifecycleService
@@ -21,7 +22,6 @@ from app.services.tags import TagState, load_tag_state
 from app.services.task_dependencies import (
     blocked_by_dependency_ids,
     dependency_ids_by_task_id,
-    dependency_status_by_id,
 )
 
 if TYPE_CHECKING:
@@ -33,7 +33,7 @@ if TYPE_CHECKING:
 
 
 def _memory_to_read(memory: BoardMemory) -> BoardMemoryRead:
-    return BoardMemoryRead.model_validate(memory, from_attributes=True)
+    return construct_trusted(BoardMemoryRead, memory)
 
 
 def _approval_to_read(
@@ -42,14 +42,12 @@ def _approval_to_read(
     task_ids: list[UUID],
     task_titles: list[str],
 ) -> ApprovalRead:
-    model = ApprovalRead.model_validate(approval, from_attributes=True)
-    primary_task_id = task_ids[0] if task_ids else None
-    return model.model_copy(
-        update={
-            "task_id": primary_task_id,
-            "task_ids": task_ids,
-            "task_titles": task_titles,
-        },
+    return construct_trusted(
+        ApprovalRead,
+        approval,
+        task_id=task_ids[0] if task_ids else None,
+        task_ids=task_ids,
+        task_titles=task_titles,
     )
 
 
@@ -62,7 +60,6 @@ def _task_to_card(
     dependency_status_by_id_map: dict[UUID, str],
     tag_state_by_task_id: dict[UUID, TagState],
 ) -> TaskCardRead:
-    card = TaskCardRead.model_validate(task, from_attributes=True)
     approvals_count, approvals_pending_count = counts_by_task_id.get(task.id, (0, 0))
     assignee = agent_name_by_id.get(task.assigned_agent_id) if task.assigned_agent_id else None
     depends_on_task_ids = deps_by_task_id.get(task.id, [])
@@ -73,17 +70,17 @@ def _task_to_card(
     )
     if task.status == "done":
         blocked_by_task_ids = []
-    return card.model_copy(
-        update={
-            "assignee": assignee,
-            "approvals_count": approvals_count,
-            "approvals_pending_count": approvals_pending_count,
-            "depends_on_task_ids": depends_on_task_ids,
-            "tag_ids": tag_state.tag_ids,
-            "tags": tag_state.tags,
-            "blocked_by_task_ids": blocked_by_task_ids,
-            "is_blocked": bool(blocked_by_task_ids),
-        },
+    return construct_trusted(
+        TaskCardRead,
+        task,
+        assignee=assignee,
+        approvals_count=approvals_count,
+        approvals_pending_count=approvals_pending_count,
+        depends_on_task_ids=depends_on_task_ids,
+        tag_ids=tag_state.tag_ids,
+        tags=tag_state.tags,
+        blocked_by_task_ids=blocked_by_task_ids,
+        is_blocked=bool(blocked_by_task_ids),
     )
 
 
@@ -107,14 +104,10 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         board_id=board.id,
         task_ids=task_ids,
     )
-    all_dependency_ids: list[UUID] = []
-    for values in deps_by_task_id.values():
-        all_dependency_ids.extend(values)
-    dependency_status_by_id_map = await dependency_status_by_id(
-        session,
-        board_id=board.id,
-        dependency_ids=list({*all_dependency_ids}),
-    )
+    # Dependencies are board-scoped, so the task list loaded above already
+    # carries every dependency status; build the map in one pass instead of
+    # issuing a second board-wide status query.
+    dependency_status_by_id_map = {task.id: task.status for task in tasks}
 
     agents = (
         await Agent.objects.filter_by(board_id=board.id)
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlmodel import col
+from sqlalchemy import bindparam, case, null
+from sqlmodel import col, select
 
 from app.core.auth import AuthContext
 from app.core.logging import TRACE_LEVEL
@@ -35,10 +39,30 @@ from app.services.openclaw.session_service import GatewayTemplateSyncQuery
 from app.services.openclaw.shared import GatewayAgentIdentity
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.users import User
 
+# Remote main-agent-entry probes hit the OpenClaw gateway once per gateway, so
+# repeated syncs within the TTL reuse the last answer. Keys include
+# ``updated_at`` so any gateway edit naturally starts a fresh entry.
+_MAIN_AGENT_ENTRY_TTL_SECONDS = 60.0
+_MAIN_AGENT_ENTRY_CACHE_MAX = 4096
+_main_agent_entry_cache: dict[tuple[UUID, object, str], tuple[float, bool]] = {}
+
+
+def _main_agent_entry_cache_key(gateway: Gateway) -> tuple[UUID, object, str]:
+    return (gateway.id, gateway.updated_at, gateway.url or "")
+
+
+def invalidate_main_agent_entry_cache(gateway_id: UUID) -> None:
+    """Drop cached main-agent-entry probe results for one gateway."""
+    stale = [key for key in _main_agent_entry_cache if key[0] == gateway_id]
+    for key in stale:
+        _main_agent_entry_cache.pop(key, None)
+
 
 class AbstractGatewayMainAgentManager(ABC):
     """Abstract manager for gateway-main agent naming/profile behavior."""
@@ -52,6 +76,17 @@ class AbstractGatewayMainAgentManager(ABC):
         raise NotImplementedError
 
 
+# Frozen template for the default gateway-agent profile; callers receive a
+# fresh copy so ORM rows never share a mutable dict.
+_GATEWAY_IDENTITY_PROFILE: Mapping[str, str] = MappingProxyType(
+    {
+        "role": "Gateway Agent",
+        "communication_style": "direct, concise, practical",
+        "emoji": ":compass:",
+    },
+)
+
+
 class DefaultGatewayMainAgentManager(AbstractGatewayMainAgentManager):
     """Default naming/profile strategy for gateway-main agents."""
 
@@ -59,16 +94,14 @@ class DefaultGatewayMainAgentManager(AbstractGatewayMainAgentManager):
         return f"{gateway.name} Gateway Agent"
 
     def build_identity_profile(self) -> dict[str, str]:
-        return {
-            "role": "Gateway Agent",
-            "communication_style": "direct, concise, practical",
-            "emoji": ":compass:",
-        }
+        return dict(_GATEWAY_IDENTITY_PROFILE)
 
 
 class GatewayAdminLifecycleService(OpenClawDBService):
     """Write-side gateway lifecycle service (CRUD, main agent, template sync)."""
 
+    __slots__ = ("_main_agent_manager",)
+
     def __init__(
         self,
         session: AsyncSession,
@@ -86,6 +119,15 @@ class GatewayAdminLifecycleService(OpenClawDBService):
     def main_agent_manager(self, value: AbstractGatewayMainAgentManager) -> None:
         self._main_agent_manager = value
 
+    # Reused across every admin gateway request; see _GATEWAY_BY_ID_STMT in
+    # gateway_resolver for the rationale.
+    _REQUIRE_GATEWAY_STMT = (
+        select(Gateway)
+        .where(col(Gateway.id) == bindparam("gateway_id"))
+        .where(col(Gateway.organization_id) == bindparam("organization_id"))
+        .limit(1)
+    )
+
     async def require_gateway(
         self,
         *,
@@ -93,10 +135,11 @@ class GatewayAdminLifecycleService(OpenClawDBService):
         organization_id: UUID,
     ) -> Gateway:
         gateway = (
-            await Gateway.objects.by_id(gateway_id)
-            .filter(col(Gateway.organization_id) == organization_id)
-            .first(self.session)
-        )
+            await self.session.exec(
+                self._REQUIRE_GATEWAY_STMT,
+                params={"gateway_id": gateway_id, "organization_id": organization_id},
+            )
+        ).first()
         if gateway is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -108,15 +151,35 @@ class GatewayAdminLifecycleService(OpenClawDBService):
         return (
             await Agent.objects.filter_by(gateway_id=gateway.id)
             .filter(col(Agent.board_id).is_(None))
+            .order_by(col(Agent.created_at).asc())
             .first(self.session)
         )
 
-    async def upsert_main_agent_record(self, gateway: Gateway) -> tuple[Agent, bool]:
+    async def bulk_find_main_agents(self, gateways: list[Gateway]) -> dict[UUID, Agent]:
+        """Load the main agents for many gateways with one IN query."""
+        gateway_ids = [gateway.id for gateway in gateways]
+        agents = (
+            await Agent.objects.by_field_in("gateway_id", gateway_ids)
+            .filter(col(Agent.board_id).is_(None))
+            .order_by(col(Agent.created_at).asc())
+            .all(self.session)
+        )
+        by_gateway: dict[UUID, Agent] = {}
+        for agent in agents:
+            if agent.gateway_id is not None and agent.gateway_id not in by_gateway:
+                by_gateway[agent.gateway_id] = agent
+        return by_gateway
+
+    async def upsert_main_agent_record(
+        self,
+        gateway: Gateway,
+        *,
+        existing: Agent | None = None,
+    ) -> tuple[Agent, bool]:
         changed = False
         session_key = GatewayAgentIdentity.session_key(gateway)
-        agent = await self.find_main_agent(gateway)
+        agent = existing if existing is not None else await self.find_main_agent(gateway)
         main_agent_name = self.main_agent_manager.build_main_agent_name(gateway)
-        identity_profile = self.main_agent_manager.build_identity_profile()
         if agent is None:
             agent = Agent(
                 name=main_agent_name,
@@ -126,10 +189,10 @@ class GatewayAdminLifecycleService(OpenClawDBService):
                 is_board_lead=False,
                 openclaw_session_id=session_key,
                 heartbeat_config=DEFAULT_HEARTBEAT_CONFIG.copy(),
-                identity_profile=identity_profile,
+                identity_profile=self.main_agent_manager.build_identity_profile(),
             )
             self.session.add(agent)
-            changed = True
+            return agent, True
         if agent.board_id is not None:
             agent.board_id = None
             changed = True
@@ -149,7 +212,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
             agent.heartbeat_config = DEFAULT_HEARTBEAT_CONFIG.copy()
             changed = True
         if agent.identity_profile is None:
-            agent.identity_profile = identity_profile
+            agent.identity_profile = self.main_agent_manager.build_identity_profile()
             changed = True
         if not agent.status:
             agent.status = "provisioning"
@@ -162,6 +225,18 @@ class GatewayAdminLifecycleService(OpenClawDBService):
     async def gateway_has_main_agent_entry(self, gateway: Gateway) -> bool:
         if not gateway.url:
             return False
+        now = time.time()
+        key = _main_agent_entry_cache_key(gateway)
+        cached = _main_agent_entry_cache.get(key)
+        if cached is not None and now - cached[0] < _MAIN_AGENT_ENTRY_TTL_SECONDS:
+            return cached[1]
+        has_entry = await self._probe_main_agent_entry(gateway)
+        if len(_main_agent_entry_cache) >= _MAIN_AGENT_ENTRY_CACHE_MAX:
+            _main_agent_entry_cache.clear()
+        _main_agent_entry_cache[key] = (now, has_entry)
+        return has_entry
+
+    async def _probe_main_agent_entry(self, gateway: Gateway) -> bool:
         config = GatewayClientConfig(
             url=gateway.url,
             token=gateway.token,
@@ -247,6 +322,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
             provisioned.id,
             action,
         )
+        invalidate_main_agent_entry_cache(gateway.id)
         return provisioned
 
     async def ensure_main_agent(
@@ -272,61 +348,90 @@ class GatewayAdminLifecycleService(OpenClawDBService):
         )
 
     async def ensure_gateway_agents_exist(self, gateways: list[Gateway]) -> None:
-        for gateway in gateways:
-            agent, gateway_changed = await self.upsert_main_agent_record(gateway)
-            has_gateway_entry = await self.gateway_has_main_agent_entry(gateway)
+        if not gateways:
+            return
+        # The remote entry probes are independent HTTP calls, so overlap them
+        # up front; DB mutations stay sequential on the shared session.
+        probe_results = await asyncio.gather(
+            *(self.gateway_has_main_agent_entry(gateway) for gateway in gateways),
+            return_exceptions=True,
+        )
+        main_agents = await self.bulk_find_main_agents(gateways)
+        pending: list[tuple[Gateway, Agent]] = []
+        upserted = False
+        for gateway, probe_result in zip(gateways, probe_results):
+            if isinstance(probe_result, BaseException):
+                self.logger.warning(
+                    "gateway.main_agent.entry_probe_failed gateway_id=%s error=%s",
+                    gateway.id,
+                    probe_result,
+                )
+                has_gateway_entry = True
+            else:
+                has_gateway_entry = probe_result
+            agent, gateway_changed = await self.upsert_main_agent_record(
+                gateway,
+                existing=main_agents.get(gateway.id),
+            )
+            upserted = upserted or gateway_changed
             needs_provision = (
                 gateway_changed or not bool(agent.agent_token_hash) or not has_gateway_entry
             )
             if needs_provision:
-                await self.provision_main_agent_record(
-                    gateway,
-                    agent,
-                    user=None,
-                    action="provision",
-                    notify=False,
-                )
+                pending.append((gateway, agent))
+        # Flush the whole batch of upserts before provisioning so new rows get
+        # ids in one round trip; run_lifecycle keeps its own per-agent commit
+        # boundaries because it provisions under a row lock.
+        if upserted:
+            await self.session.flush()
+        for gateway, agent in pending:
+            await self.provision_main_agent_record(
+                gateway,
+                agent,
+                user=None,
+                action="provision",
+                notify=False,
+            )
 
     async def clear_agent_foreign_keys(self, *, agent_id: UUID) -> None:
+        await self.clear_agents_foreign_keys(agent_ids=[agent_id])
+
+    async def clear_agents_foreign_keys(self, *, agent_ids: list[UUID]) -> None:
+        """Detach many agents from dependent rows with one UPDATE per table."""
+        if not agent_ids:
+            return
         now = utcnow()
+        # One UPDATE covers both branches: in-progress tasks return to the
+        # inbox while other statuses keep their state, CASE picks per row.
+        in_progress = col(Task.status) == "in_progress"
         await crud.update_where(
             self.session,
             Task,
-            col(Task.assigned_agent_id) == agent_id,
-            col(Task.status) == "in_progress",
-            assigned_agent_id=None,
-            status="inbox",
-            in_progress_at=None,
-            updated_at=now,
-            commit=False,
-        )
-        await crud.update_where(
-            self.session,
-            Task,
-            col(Task.assigned_agent_id) == agent_id,
-            col(Task.status) != "in_progress",
+            col(Task.assigned_agent_id).in_(agent_ids),
             assigned_agent_id=None,
+            status=case((in_progress, "inbox"), else_=col(Task.status)),
+            in_progress_at=case((in_progress, null()), else_=col(Task.in_progress_at)),
             updated_at=now,
             commit=False,
         )
         await crud.update_where(
             self.session,
             ActivityEvent,
-            col(ActivityEvent.agent_id) == agent_id,
+            col(ActivityEvent.agent_id).in_(agent_ids),
             agent_id=None,
             commit=False,
         )
         await crud.update_where(
             self.session,
             Approval,
-            col(Approval.agent_id) == agent_id,
+            col(Approval.agent_id).in_(agent_ids),
             agent_id=None,
             commit=False,
         )
         await crud.update_where(
             self.session,
             BoardWebhook,
-            col(BoardWebhook.agent_id) == agent_id,
+            col(BoardWebhook.agent_id).in_(agent_ids),
             agent_id=None,
             updated_at=now,
             commit=False,
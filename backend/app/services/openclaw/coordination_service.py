@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from abc import ABC
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
@@ -12,6 +11,7 @@ from fastapi import HTTPException, status
 from sqlmodel import col, select
 
 from app.core.config import settings
+from app.core.jsonio import json_dumps
 from app.core.logging import TRACE_LEVEL
 from app.core.time import utcnow
 from app.models.agents import Agent
@@ -97,7 +97,7 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
         header = "GATEWAY MAIN QUESTION" if kind == "question" else "GATEWAY MAIN HANDOFF"
         correlation = correlation_id.strip() if correlation_id else ""
         correlation_line = f"Correlation ID: {correlation}\n" if correlation else ""
-        tags_json = json.dumps(reply_tags or ["gateway_main", "lead_reply"])
+        tags_json = json_dumps(reply_tags or ["gateway_main", "lead_reply"])
         source = reply_source or "lead_to_gateway_main"
         return (
             f"{header}\n"
@@ -435,7 +435,7 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
         preferred_channel = (payload.preferred_channel or "").strip()
         channel_line = f"Preferred channel: {preferred_channel}\n" if preferred_channel else ""
         tags = payload.reply_tags or ["gateway_main", "user_reply"]
-        tags_json = json.dumps(tags)
+        tags_json = json_dumps(tags)
         reply_source = payload.reply_source or "user_via_gateway_main"
         base_url = settings.base_url or "http://localhost:8000"
         message = (
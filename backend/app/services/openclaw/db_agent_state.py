@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Final, Literal
 
 from app.core.agent_tokens import generate_agent_token, hash_agent_token
 from app.core.time import utcnow
 from app.models.agents import Agent
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
 
+# Shared lifecycle status constants. CPython interns these literals on its
+# own, so comparisons on the provisioning hot path are pointer compares;
+# Final keeps the inferred Literal types compatible with the status params.
+STATUS_ONLINE: Final = "online"
+STATUS_OFFLINE: Final = "offline"
+STATUS_PROVISIONING: Final = "provisioning"
+STATUS_UPDATING: Final = "updating"
+STATUS_DELETING: Final = "deleting"
+
 
 def ensure_heartbeat_config(agent: Agent) -> None:
     """Ensure an agent has a heartbeat_config dict populated."""
@@ -34,17 +43,18 @@ def mark_provision_requested(
     """Mark an agent as pending provisioning/update."""
 
     ensure_heartbeat_config(agent)
-    agent.provision_requested_at = utcnow()
+    now = utcnow()
+    agent.provision_requested_at = now
     agent.provision_action = action
     if status is not None:
         agent.status = status
-    agent.updated_at = utcnow()
+    agent.updated_at = now
 
 
 def mark_provision_complete(
     agent: Agent,
     *,
-    status: Literal["online", "offline", "provisioning", "updating", "deleting"] = "online",
+    status: Literal["online", "offline", "provisioning", "updating", "deleting"] = STATUS_ONLINE,
     clear_confirm_token: bool = False,
 ) -> None:
     """Clear provisioning fields after a successful gateway lifecycle run."""
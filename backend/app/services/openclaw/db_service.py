@@ -7,7 +7,7 @@ OpenClaw services without adding new architectural layers.
 from __future__ import annotations
 
 from logging import Logger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from app.core.logging import get_logger
 
@@ -18,10 +18,21 @@ if TYPE_CHECKING:
 class OpenClawDBService:
     """Base class for OpenClaw services that require an AsyncSession."""
 
+    # One service instance is created per request; slots keep them dict-free.
+    __slots__ = ("_logger", "_session")
+
+    # Loggers are identical per subclass; resolve them once at class-definition
+    # time instead of taking the logging-manager lock on every instantiation.
+    _class_logger: ClassVar[Logger] = get_logger(__name__)
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # Use the concrete subclass module for logger naming.
+        cls._class_logger = get_logger(cls.__module__)
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
-        # Use the concrete subclass module for logger naming.
-        self._logger = get_logger(self.__class__.__module__)
+        self._logger = self._class_logger
 
     @property
     def session(self) -> AsyncSession:
@@ -40,10 +51,8 @@ class OpenClawDBService:
         self._logger = value
 
     async def add_commit_refresh(self, model: object) -> None:
-        """Persist a model, committing the current transaction and refreshing when supported."""
+        """Persist a model, committing the current transaction and refreshing it."""
 
         self.session.add(model)
         await self.session.commit()
-        refresh = getattr(self.session, "refresh", None)
-        if callable(refresh):
-            await refresh(model)
+        await self.session.refresh(model)
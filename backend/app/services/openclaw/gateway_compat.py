@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -14,6 +16,9 @@ from app.services.openclaw.gateway_rpc import (
     openclaw_connect_metadata,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 _CALVER_PATTERN = re.compile(
     r"^v?(?P<year>\d{4})\.(?P<month>\d{1,2})\.(?P<day>\d{1,2})(?:-(?P<rev>\d+))?$",
     re.IGNORECASE,
@@ -64,15 +69,29 @@ def _compare_versions(left: tuple[int, ...], right: tuple[int, ...]) -> int:
     return 0
 
 
-def _value_at_path(payload: object, path: tuple[str, ...]) -> object | None:
-    current = payload
-    for segment in path:
-        if not isinstance(current, dict):
-            return None
-        if segment not in current:
+@lru_cache(maxsize=64)
+def _compile_path_getter(path: tuple[str, ...]) -> Callable[[object], object | None]:
+    """Build a direct-indexing accessor for a static payload path.
+
+    The returned closure indexes straight through nested dicts and lets the
+    exception path absorb shape mismatches, skipping the per-segment
+    isinstance-and-membership branches of a generic walker.
+    """
+
+    def getter(payload: object) -> object | None:
+        current = payload
+        try:
+            for segment in path:
+                current = current[segment]  # type: ignore[index]
+        except (KeyError, TypeError):
             return None
-        current = current[segment]
-    return current
+        return current
+
+    return getter
+
+
+_connect_version_getter = _compile_path_getter(_CONNECT_VERSION_PATH)
+_config_version_getter = _compile_path_getter(_CONFIG_VERSION_PATH)
 
 
 def _coerce_version_string(value: object) -> str | None:
@@ -86,12 +105,12 @@ def _coerce_version_string(value: object) -> str | None:
 
 def extract_connect_server_version(payload: object) -> str | None:
     """Extract the canonical runtime version from connect metadata."""
-    return _coerce_version_string(_value_at_path(payload, _CONNECT_VERSION_PATH))
+    return _coerce_version_string(_connect_version_getter(payload))
 
 
 def extract_config_last_touched_version(payload: object) -> str | None:
     """Extract a runtime version hint from config.get payload."""
-    return _coerce_version_string(_value_at_path(payload, _CONFIG_VERSION_PATH))
+    return _coerce_version_string(_config_version_getter(payload))
 
 
 def evaluate_gateway_version(
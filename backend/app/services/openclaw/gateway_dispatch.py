@@ -6,7 +6,10 @@ directly orchestrate gateway RPC calls.
 
 from __future__ import annotations
 
-from uuid import uuid4
+import secrets
+import time
+from typing import TYPE_CHECKING
+from uuid import UUID
 
 from app.models.boards import Board
 from app.models.gateways import Gateway
@@ -20,22 +23,58 @@ from app.services.openclaw.gateway_resolver import (
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError, ensure_session, send_message
 
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Session keys recently confirmed live via ensure_session, mapped to their
+# cache expiry (time.time() seconds). Repeated sends to the same agent skip the
+# ensure round-trip; the TTL bounds staleness against gateway-side expiry.
+_LIVE_SESSION_TTL_SECONDS = 300.0
+_LIVE_SESSION_CACHE_MAX = 4096
+_live_sessions: dict[tuple[str, str], float] = {}
+
 
 class GatewayDispatchService(OpenClawDBService):
     """Resolve gateway config for boards and dispatch messages to agent sessions."""
 
+    __slots__ = ("_gateway_cache",)
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+        # Per-request memo of gateway rows keyed by gateway id; the service
+        # lives for one request, so staleness is bounded by the current
+        # transaction and repeat lookups skip the extra SELECT.
+        self._gateway_cache: dict[UUID, Gateway | None] = {}
+
+    async def _get_gateway_for_board(self, board: Board) -> Gateway | None:
+        gateway_id = board.gateway_id
+        if gateway_id is None:
+            return None
+        if gateway_id in self._gateway_cache:
+            return self._gateway_cache[gateway_id]
+        gateway = await get_gateway_for_board(self.session, board)
+        self._gateway_cache[gateway_id] = gateway
+        return gateway
+
     async def optional_gateway_config_for_board(
         self,
         board: Board,
     ) -> GatewayClientConfig | None:
-        gateway = await get_gateway_for_board(self.session, board)
+        gateway = await self._get_gateway_for_board(board)
         return optional_gateway_client_config(gateway)
 
     async def require_gateway_config_for_board(
         self,
         board: Board,
     ) -> tuple[Gateway, GatewayClientConfig]:
-        gateway = await require_gateway_for_board(self.session, board)
+        gateway = None
+        if board.gateway_id is not None:
+            gateway = self._gateway_cache.get(board.gateway_id)
+        if gateway is None:
+            # Cache miss (or a cached None from the optional path); the
+            # resolver re-checks and raises the canonical 422s.
+            gateway = await require_gateway_for_board(self.session, board)
+            self._gateway_cache[gateway.id] = gateway
         return gateway, gateway_client_config(gateway)
 
     async def send_agent_message(
@@ -47,8 +86,20 @@ class GatewayDispatchService(OpenClawDBService):
         message: str,
         deliver: bool = False,
     ) -> None:
-        await ensure_session(session_key, config=config, label=agent_name)
-        await send_message(message, session_key=session_key, config=config, deliver=deliver)
+        key = (config.url, session_key)
+        now = time.time()
+        expires_at = _live_sessions.get(key)
+        if expires_at is None or expires_at <= now:
+            await ensure_session(session_key, config=config, label=agent_name)
+            if len(_live_sessions) >= _LIVE_SESSION_CACHE_MAX:
+                _live_sessions.clear()
+            _live_sessions[key] = now + _LIVE_SESSION_TTL_SECONDS
+        try:
+            await send_message(message, session_key=session_key, config=config, deliver=deliver)
+        except OpenClawGatewayError:
+            # The session may have gone away gateway-side; re-establish next time.
+            _live_sessions.pop(key, None)
+            raise
 
     async def try_send_agent_message(
         self,
@@ -76,4 +127,6 @@ class GatewayDispatchService(OpenClawDBService):
         normalized = (correlation_id or "").strip()
         if normalized:
             return normalized
-        return f"{prefix}:{uuid4().hex[:12]}"
+        # Same 48 bits of entropy as the old uuid4().hex[:12] slice, without
+        # building a throwaway UUID object.
+        return f"{prefix}:{secrets.token_hex(6)}"
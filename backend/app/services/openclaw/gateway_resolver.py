@@ -14,6 +14,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam
+from sqlmodel import col, select
 
 from app.models.boards import Board
 from app.models.gateways import Gateway
@@ -22,6 +24,13 @@ from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConf
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+# Stable 422 details, defined once so the error paths only pay for the
+# HTTPException itself and callers/tests can match on the exact strings.
+_GATEWAY_URL_REQUIRED_DETAIL = "Gateway url is required"
+_GATEWAY_WORKSPACE_ROOT_REQUIRED_DETAIL = "Gateway workspace_root is required"
+_BOARD_GATEWAY_REQUIRED_DETAIL = "Board gateway_id is required"
+_BOARD_GATEWAY_INVALID_DETAIL = "Board gateway_id is invalid"
+
 
 def gateway_client_config(gateway: Gateway) -> GatewayClientConfig:
     """Build a gateway RPC config from a Gateway model, requiring a URL."""
@@ -29,7 +38,7 @@ def gateway_client_config(gateway: Gateway) -> GatewayClientConfig:
     if not url:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail="Gateway url is required",
+            detail=_GATEWAY_URL_REQUIRED_DETAIL,
         )
     token = (gateway.token or "").strip() or None
     return GatewayClientConfig(
@@ -62,11 +71,17 @@ def require_gateway_workspace_root(gateway: Gateway) -> str:
     if not workspace_root:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail="Gateway workspace_root is required",
+            detail=_GATEWAY_WORKSPACE_ROOT_REQUIRED_DETAIL,
         )
     return workspace_root
 
 
+# Built once at import time: every gateway RPC request resolves its board's
+# gateway, so reusing one statement object skips per-call select() construction
+# and keeps SQLAlchemy's compiled-SQL cache keyed on a single statement.
+_GATEWAY_BY_ID_STMT = select(Gateway).where(col(Gateway.id) == bindparam("gateway_id")).limit(1)
+
+
 async def get_gateway_for_board(
     session: AsyncSession,
     board: Board,
@@ -74,7 +89,9 @@ async def get_gateway_for_board(
     """Return the gateway for a board when present and valid; otherwise return None."""
     if board.gateway_id is None:
         return None
-    gateway = await Gateway.objects.by_id(board.gateway_id).first(session)
+    gateway = (
+        await session.exec(_GATEWAY_BY_ID_STMT, params={"gateway_id": board.gateway_id})
+    ).first()
     if gateway is None:
         return None
     # Defensive guard: boards and gateways are tenant-scoped; reject cross-org mismatches.
@@ -90,16 +107,17 @@ async def require_gateway_for_board(
     require_workspace_root: bool = False,
 ) -> Gateway:
     """Return a board's gateway or raise a 422 with a stable error message."""
-    if board.gateway_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail="Board gateway_id is required",
-        )
-    gateway = await get_gateway_for_board(session, board)
+    gateway = None if board.gateway_id is None else await get_gateway_for_board(session, board)
     if gateway is None:
+        # One raise covers both failure shapes; only the detail differs.
+        detail = (
+            _BOARD_GATEWAY_REQUIRED_DETAIL
+            if board.gateway_id is None
+            else _BOARD_GATEWAY_INVALID_DETAIL
+        )
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail="Board gateway_id is invalid",
+            detail=detail,
         )
     if require_workspace_root:
         require_gateway_workspace_root(gateway)
@@ -8,7 +8,6 @@ operate within a single scope (no `app.integrations.*` plumbing).
 from __future__ import annotations
 
 import asyncio
-import json
 import ssl
 from dataclasses import dataclass
 from time import perf_counter, time
@@ -19,6 +18,7 @@ from uuid import uuid4
 import websockets
 from websockets.exceptions import WebSocketException
 
+from app.core.jsonio import json_dumps, json_loads
 from app.core.logging import TRACE_LEVEL, get_logger
 from app.services.openclaw.device_identity import (
     build_device_auth_payload,
@@ -272,26 +272,29 @@ async def _await_response(
 ) -> object:
     while True:
         raw = await ws.recv()
-        data = json.loads(raw)
+        data = json_loads(raw)
+        message_type = data.get("type")
         logger.log(
             TRACE_LEVEL,
             "gateway.rpc.recv request_id=%s type=%s",
             request_id,
-            data.get("type"),
+            message_type,
         )
 
-        if data.get("type") == "res" and data.get("id") == request_id:
+        if data.get("id") != request_id:
+            continue
+
+        if message_type == "res":
             ok = data.get("ok")
             if ok is not None and not ok:
                 error = data.get("error", {}).get("message", "Gateway error")
                 raise OpenClawGatewayError(error)
             return data.get("payload")
 
-        if data.get("id") == request_id:
-            if data.get("error"):
-                message = data["error"].get("message", "Gateway error")
-                raise OpenClawGatewayError(message)
-            return data.get("result")
+        if data.get("error"):
+            message = data["error"].get("message", "Gateway error")
+            raise OpenClawGatewayError(message)
+        return data.get("result")
 
 
 async def _send_request(
@@ -313,7 +316,7 @@ async def _send_request(
         request_id,
         sorted((params or {}).keys()),
     )
-    await ws.send(json.dumps(message))
+    await ws.send(json_dumps(message))
     return await _await_response(ws, request_id)
 
 
@@ -361,7 +364,7 @@ async def _ensure_connected(
     if first_message:
         if isinstance(first_message, bytes):
             first_message = first_message.decode("utf-8")
-        data = json.loads(first_message)
+        data = json_loads(first_message)
         if data.get("type") == "event" and data.get("event") == "connect.challenge":
             payload = data.get("payload")
             if isinstance(payload, dict):
@@ -381,7 +384,7 @@ async def _ensure_connected(
         "method": "connect",
         "params": _build_connect_params(config, connect_nonce=connect_nonce),
     }
-    await ws.send(json.dumps(response))
+    await ws.send(json_dumps(response))
     return await _await_response(ws, connect_id)
 
 
@@ -394,22 +397,107 @@ async def _recv_first_message_or_none(
         return None
 
 
-async def _openclaw_call_once(
-    method: str,
-    params: dict[str, Any] | None,
-    *,
+async def _open_authenticated_connection(
     config: GatewayConfig,
     gateway_url: str,
-) -> object:
+) -> websockets.ClientConnection:
     origin = _build_control_ui_origin(gateway_url) if config.disable_device_pairing else None
     ssl_context = _create_ssl_context(config)
     connect_kwargs: dict[str, Any] = {"ping_interval": None}
     if origin is not None:
         connect_kwargs["origin"] = origin
-    async with websockets.connect(gateway_url, ssl=ssl_context, **connect_kwargs) as ws:
+    ws = await websockets.connect(gateway_url, ssl=ssl_context, **connect_kwargs)
+    try:
         first_message = await _recv_first_message_or_none(ws)
         await _ensure_connected(ws, first_message, config)
-        return await _send_request(ws, method, params)
+    except BaseException:
+        await ws.close()
+        raise
+    return ws
+
+
+class _PooledGatewayConnection:
+    """An authenticated gateway websocket shared across RPC calls.
+
+    Requests are serialized per connection because ``_await_response`` drains
+    frames until it sees its own request id.
+    """
+
+    def __init__(self, ws: websockets.ClientConnection) -> None:
+        self.ws = ws
+        self.lock = asyncio.Lock()
+        self.loop = asyncio.get_running_loop()
+
+
+_connection_pool: dict[tuple[str, bool, bool], _PooledGatewayConnection] = {}
+
+
+def _pool_key(config: GatewayConfig, gateway_url: str) -> tuple[str, bool, bool]:
+    # gateway_url embeds the token, so rotated tokens get fresh connections.
+    return (gateway_url, config.allow_insecure_tls, config.disable_device_pairing)
+
+
+async def _acquire_pooled_connection(
+    config: GatewayConfig,
+    gateway_url: str,
+) -> _PooledGatewayConnection:
+    key = _pool_key(config, gateway_url)
+    conn = _connection_pool.get(key)
+    if conn is not None and conn.loop is not asyncio.get_running_loop():
+        _connection_pool.pop(key, None)
+        conn = None
+    if conn is None:
+        ws = await _open_authenticated_connection(config, gateway_url)
+        conn = _connection_pool.get(key)
+        if conn is not None and conn.loop is asyncio.get_running_loop():
+            # Another coroutine populated the pool while we were handshaking;
+            # keep its connection and close the duplicate so it cannot leak.
+            try:
+                await ws.close()
+            except (ConnectionError, OSError, WebSocketException):  # pragma: no cover
+                pass
+            return conn
+        conn = _PooledGatewayConnection(ws)
+        _connection_pool[key] = conn
+    return conn
+
+
+async def _discard_pooled_connection(
+    key: tuple[str, bool, bool],
+    conn: _PooledGatewayConnection,
+) -> None:
+    if _connection_pool.get(key) is conn:
+        _connection_pool.pop(key, None)
+    try:
+        await conn.ws.close()
+    except (ConnectionError, OSError, WebSocketException):  # pragma: no cover
+        pass
+
+
+async def _openclaw_call_once(
+    method: str,
+    params: dict[str, Any] | None,
+    *,
+    config: GatewayConfig,
+    gateway_url: str,
+) -> object:
+    # Reuse one authenticated connection per gateway so repeated RPC calls
+    # skip the TCP/TLS/connect handshake; retry once on a fresh connection
+    # when a pooled socket has gone stale.
+    key = _pool_key(config, gateway_url)
+    conn = await _acquire_pooled_connection(config, gateway_url)
+    async with conn.lock:
+        try:
+            return await _send_request(conn.ws, method, params)
+        except (ConnectionError, OSError, WebSocketException):
+            await _discard_pooled_connection(key, conn)
+    conn = await _acquire_pooled_connection(config, gateway_url)
+    async with conn.lock:
+        try:
+            return await _send_request(conn.ws, method, params)
+        except (ConnectionError, OSError, WebSocketException):
+            await _discard_pooled_connection(key, conn)
+            raise
 
 
 async def _openclaw_connect_metadata_once(
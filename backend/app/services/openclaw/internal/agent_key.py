@@ -3,22 +3,43 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from uuid import uuid4
 
 from app.models.agents import Agent
 from app.services.openclaw.constants import _SESSION_KEY_PARTS_MIN
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def _slugify_text(value: str) -> str:
+    return _SLUG_RE.sub("-", value.lower()).strip("-")
+
 
 def slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _slugify_text(value)
     return slug or uuid4().hex
 
 
+@lru_cache(maxsize=4096)
+def _session_agent_id(session_key: str) -> str | None:
+    """Parse the agent id out of an ``agent:<id>:...`` session key.
+
+    Session keys repeat across dispatches and heartbeats, so the split is
+    cached rather than re-parsed per call.
+    """
+    if not session_key.startswith("agent:"):
+        return None
+    parts = session_key.split(":")
+    if len(parts) >= _SESSION_KEY_PARTS_MIN and parts[1]:
+        return parts[1]
+    return None
+
+
 def agent_key(agent: Agent) -> str:
     """Return stable gateway agent id derived from session key or name fallback."""
-    session_key = agent.openclaw_session_id or ""
-    if session_key.startswith("agent:"):
-        parts = session_key.split(":")
-        if len(parts) >= _SESSION_KEY_PARTS_MIN and parts[1]:
-            return parts[1]
+    key = _session_agent_id(agent.openclaw_session_id or "")
+    if key is not None:
+        return key
     return slugify(agent.name)
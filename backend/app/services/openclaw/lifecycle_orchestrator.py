@@ -18,6 +18,9 @@ from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.services.openclaw.constants import CHECKIN_DEADLINE_AFTER_WAKE
 from app.services.openclaw.db_agent_state import (
+    STATUS_ONLINE,
+    STATUS_PROVISIONING,
+    STATUS_UPDATING,
     mark_provision_complete,
     mark_provision_requested,
     mint_agent_token,
@@ -40,6 +43,8 @@ if TYPE_CHECKING:
 class AgentLifecycleOrchestrator(OpenClawDBService):
     """Single lifecycle writer for agent provision/update transitions."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
@@ -89,14 +94,15 @@ class AgentLifecycleOrchestrator(OpenClawDBService):
         mark_provision_requested(
             locked,
             action=action,
-            status="updating" if action == "update" else "provisioning",
+            status=STATUS_UPDATING if action == "update" else STATUS_PROVISIONING,
         )
+        now = utcnow()
         locked.lifecycle_generation += 1
         locked.last_provision_error = None
-        locked.checkin_deadline_at = utcnow() + CHECKIN_DEADLINE_AFTER_WAKE if wake else None
+        locked.checkin_deadline_at = now + CHECKIN_DEADLINE_AFTER_WAKE if wake else None
         if wake:
             locked.wake_attempts += 1
-            locked.last_wake_sent_at = utcnow()
+            locked.last_wake_sent_at = now
         self.session.add(locked)
         await self.session.flush()
 
@@ -146,7 +152,7 @@ class AgentLifecycleOrchestrator(OpenClawDBService):
 
         mark_provision_complete(
             locked,
-            status="online",
+            status=STATUS_ONLINE,
             clear_confirm_token=clear_confirm_token,
         )
         locked.last_provision_error = None
@@ -7,16 +7,18 @@ DB-backed workflows (template sync, lead-agent record creation) live in
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
 
 from app.core.config import settings
+from app.core.jsonio import json_dumps
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.gateways import Gateway
@@ -119,7 +121,9 @@ def _channel_heartbeat_visibility_patch(config_data: dict[str, Any]) -> dict[str
     heartbeat = defaults.get("heartbeat")
     if not isinstance(heartbeat, dict):
         return {"defaults": {"heartbeat": DEFAULT_CHANNEL_HEARTBEAT_VISIBILITY.copy()}}
-    merged = dict(heartbeat)
+    # heartbeat is isinstance-checked above; dict.copy skips the dict()
+    # constructor's generic-mapping dispatch.
+    merged = heartbeat.copy()
     changed = False
     for key, value in DEFAULT_CHANNEL_HEARTBEAT_VISIBILITY.items():
         if key not in merged:
@@ -130,7 +134,10 @@ def _channel_heartbeat_visibility_patch(config_data: dict[str, Any]) -> dict[str
     return {"defaults": {"heartbeat": merged}}
 
 
+@lru_cache(maxsize=1)
 def _template_env() -> Environment:
+    # One shared environment keeps Jinja's compiled-template cache warm across
+    # renders; the FileSystemLoader still auto-reloads templates edited on disk.
     return Environment(
         loader=FileSystemLoader(_templates_root()),
         # Render markdown verbatim (HTML escaping makes it harder for agents to read).
@@ -237,7 +244,10 @@ def _identity_context(agent: Agent) -> dict[str, str]:
     return {**identity_context, **extra_identity_context}
 
 
+@lru_cache(maxsize=256)
 def _role_slug(role: str) -> str:
+    # Roles repeat across agents, so the strip/lower/regex pass runs once per
+    # distinct role string.
     tokens = _ROLE_SOUL_WORD_RE.findall(role.strip().lower())
     return "-".join(tokens)
 
@@ -251,15 +261,19 @@ def _select_role_soul_ref(
     if not role_slug:
         return None
 
-    exact_slug = next((ref for ref in refs if ref.slug.lower() == role_slug), None)
+    # Lowercase each slug once instead of per matching pass.
+    lowered = [(ref.slug.lower(), ref) for ref in refs]
+
+    exact_slug = next((ref for slug, ref in lowered if slug == role_slug), None)
     if exact_slug is not None:
         return exact_slug
 
-    prefix_matches = [ref for ref in refs if ref.slug.lower().startswith(f"{role_slug}-")]
+    role_slug_prefix = f"{role_slug}-"
+    prefix_matches = [ref for slug, ref in lowered if slug.startswith(role_slug_prefix)]
     if prefix_matches:
         return sorted(prefix_matches, key=lambda ref: len(ref.slug))[0]
 
-    contains_matches = [ref for ref in refs if role_slug in ref.slug.lower()]
+    contains_matches = [ref for slug, ref in lowered if role_slug in slug]
     if contains_matches:
         return sorted(contains_matches, key=lambda ref: len(ref.slug))[0]
 
@@ -328,7 +342,7 @@ def _build_context(
         "board_name": board.name,
         "board_type": board.board_type,
         "board_objective": board.objective or "",
-        "board_success_metrics": json.dumps(board.success_metrics or {}),
+        "board_success_metrics": json_dumps(board.success_metrics or {}),
         "board_target_date": board.target_date.isoformat() if board.target_date else "",
         "board_goal_confirmed": str(board.goal_confirmed).lower(),
         "board_rule_require_approval_for_done": str(board.require_approval_for_done).lower(),
@@ -577,7 +591,9 @@ class OpenClawGatewayControlPlane(GatewayControlPlane):
             if not isinstance(name, str) or not name:
                 name = item.get("path")
             if isinstance(name, str) and name:
-                index[name] = dict(item)
+                # No defensive copy: the payload is local to this call and
+                # consumers only read the entries.
+                index[name] = item
         return index
 
     async def get_agent_file_payload(self, *, agent_id: str, name: str) -> object:
@@ -609,11 +625,16 @@ class OpenClawGatewayControlPlane(GatewayControlPlane):
         entry_by_id = _heartbeat_entry_map(entries)
         new_list = _updated_agent_list(raw_list, entry_by_id)
 
-        patch: dict[str, Any] = {"agents": {"list": new_list}}
         channels_patch = _channel_heartbeat_visibility_patch(config_data)
+        if channels_patch is None and new_list == raw_list:
+            # The gateway config already reflects every entry; skip the
+            # config.patch round-trip instead of pushing an identical payload.
+            return
+
+        patch: dict[str, Any] = {"agents": {"list": new_list}}
         if channels_patch is not None:
             patch["channels"] = channels_patch
-        params = {"raw": json.dumps(patch)}
+        params = {"raw": json_dumps(patch)}
         if base_hash:
             params["baseHash"] = base_hash
         await openclaw_call("config.patch", params, config=self._config)
@@ -652,6 +673,9 @@ def _updated_agent_list(
     raw_list: list[object],
     entry_by_id: dict[str, tuple[str, dict[str, Any]]],
 ) -> list[object]:
+    if not entry_by_id:
+        return list(raw_list)
+
     updated_ids: set[str] = set()
     new_list: list[object] = []
 
@@ -660,15 +684,24 @@ def _updated_agent_list(
             new_list.append(raw_entry)
             continue
         agent_id = raw_entry.get("id")
-        if not isinstance(agent_id, str) or agent_id not in entry_by_id:
+        if not isinstance(agent_id, str):
+            new_list.append(raw_entry)
+            continue
+        entry = entry_by_id.get(agent_id)
+        if entry is None:
             new_list.append(raw_entry)
             continue
 
-        workspace_path, heartbeat = entry_by_id[agent_id]
-        new_entry = dict(raw_entry)
-        new_entry["workspace"] = workspace_path
-        new_entry["heartbeat"] = heartbeat
-        new_list.append(new_entry)
+        workspace_path, heartbeat = entry
+        if raw_entry.get("workspace") == workspace_path and raw_entry.get("heartbeat") == heartbeat:
+            # Cheap equality first: most syncs find the entry already correct,
+            # so skip the copy (and keep the no-op patch detection exact).
+            new_list.append(raw_entry)
+        else:
+            new_entry = raw_entry.copy()
+            new_entry["workspace"] = workspace_path
+            new_entry["heartbeat"] = heartbeat
+            new_list.append(new_entry)
         updated_ids.add(agent_id)
 
     for agent_id, (workspace_path, heartbeat) in entry_by_id.items():
@@ -749,6 +782,7 @@ class BaseAgentLifecycleManager(ABC):
         target_file_names = desired_file_names or set(rendered.keys())
         unsupported_names: list[str] = []
 
+        write_names: list[str] = []
         for name, content in rendered.items():
             if content == "":
                 continue
@@ -759,17 +793,30 @@ class BaseAgentLifecycleManager(ABC):
                 entry = existing_files.get(name)
                 if entry and not bool(entry.get("missing")):
                     continue
-            try:
-                await self._control_plane.set_agent_file(
-                    agent_id=agent_id,
-                    name=name,
-                    content=content,
-                )
-            except OpenClawGatewayError as exc:
-                if "unsupported file" in str(exc).lower():
-                    unsupported_names.append(name)
-                    continue
-                raise
+            write_names.append(name)
+
+        if write_names:
+            # Each file write is an independent RPC, so overlap them instead of
+            # paying one gateway round trip per file.
+            write_results = await asyncio.gather(
+                *(
+                    self._control_plane.set_agent_file(
+                        agent_id=agent_id,
+                        name=name,
+                        content=rendered[name],
+                    )
+                    for name in write_names
+                ),
+                return_exceptions=True,
+            )
+            for name, write_result in zip(write_names, write_results, strict=True):
+                if isinstance(write_result, OpenClawGatewayError):
+                    if "unsupported file" in str(write_result).lower():
+                        unsupported_names.append(name)
+                        continue
+                    raise write_result
+                if isinstance(write_result, BaseException):
+                    raise write_result
 
         if agent is not None and agent.is_board_lead and unsupported_names:
             unsupported_sorted = ", ".join(sorted(set(unsupported_names)))
@@ -891,7 +938,7 @@ class BoardAgentLifecycleManager(BaseAgentLifecycleManager):
         agent: Agent,
         context: dict[str, str],
     ) -> dict[str, str]:
-        context = dict(context)
+        context = context.copy()
         if agent.is_board_lead:
             context["directory_role_soul_markdown"] = ""
             context["directory_role_soul_source_url"] = ""
@@ -1019,17 +1066,18 @@ class OpenClawGatewayProvisioner:
 
     async def sync_gateway_agent_heartbeats(self, gateway: Gateway, agents: list[Agent]) -> None:
         """Sync current Agent.heartbeat_config values to the gateway config."""
-        if not gateway.workspace_root:
+        workspace_root = gateway.workspace_root
+        if not workspace_root:
             msg = "gateway workspace_root is required"
             raise OpenClawGatewayError(msg)
-        entries: list[tuple[str, str, dict[str, Any]]] = []
-        for agent in agents:
-            agent_id = _agent_key(agent)
-            workspace_path = _workspace_path(agent, gateway.workspace_root)
-            heartbeat = _heartbeat_config(agent)
-            entries.append((agent_id, workspace_path, heartbeat))
-        if not entries:
+        if not agents:
             return
+        # Hoist the gateway attribute lookup out of the per-agent pass; the
+        # helpers themselves are already per-agent work.
+        entries = [
+            (_agent_key(agent), _workspace_path(agent, workspace_root), _heartbeat_config(agent))
+            for agent in agents
+        ]
         await _patch_gateway_agent_heartbeats(gateway, entries=entries)
 
     async def apply_agent_lifecycle(
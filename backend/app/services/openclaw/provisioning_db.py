@@ -9,7 +9,6 @@ Layering:
 from __future__ import annotations
 
 import asyncio
-import json
 import re
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -17,7 +16,7 @@ from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException, Request, status
-from sqlalchemy import asc, func, or_
+from sqlalchemy import asc, case, func, null, or_
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
@@ -42,6 +41,7 @@ from app.schemas.agents import (
     AgentHeartbeatCreate,
     AgentRead,
     AgentUpdate,
+    dump_agent_event,
 )
 from app.schemas.common import OkResponse
 from app.schemas.gateways import GatewayTemplatesSyncError, GatewayTemplatesSyncResult
@@ -140,6 +140,8 @@ class LeadAgentRequest:
 class OpenClawProvisioningService(OpenClawDBService):
     """DB-backed provisioning workflows (bulk template sync, lead-agent record)."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
@@ -711,6 +713,14 @@ async def _sync_main_agent(
     return stop_sync
 
 
+# Agent fields that only affect server-side state; updates limited to these do
+# not change anything provisioned on the gateway, so the full re-sync (token
+# rotation, template push, wake) can be skipped. heartbeat_config does NOT
+# belong here: the update pipeline pushes it into the gateway config via
+# patch_agent_heartbeats.
+_GATEWAY_NEUTRAL_UPDATE_FIELDS = frozenset({"status"})
+
+
 class ActorContextLike(Protocol):
     """Minimal actor context contract consumed by lifecycle APIs."""
 
@@ -748,7 +758,11 @@ class AgentUpdateProvisionRequest:
 
 
 class AgentLifecycleService(OpenClawDBService):
-    """Async service encapsulating agent lifecycle behavior for API routes."""
+    """Async service encapsulating agent lifecycle behavior for API routes.
+
+    No ``__slots__`` here: tests monkeypatch per-instance methods on this
+    service, which needs an instance ``__dict__``.
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
@@ -844,9 +858,9 @@ class AgentLifecycleService(OpenClawDBService):
 
     @classmethod
     def to_agent_read(cls, agent: Agent) -> AgentRead:
-        model = AgentRead.model_validate(agent, from_attributes=True)
-        return model.model_copy(
-            update={"is_gateway_main": cls.is_gateway_main(agent)},
+        return AgentRead.from_orm_trusted(
+            agent,
+            is_gateway_main=cls.is_gateway_main(agent),
         )
 
     @staticmethod
@@ -876,8 +890,8 @@ class AgentLifecycleService(OpenClawDBService):
         return agent
 
     @classmethod
-    def serialize_agent(cls, agent: Agent) -> dict[str, object]:
-        return cls.to_agent_read(cls.with_computed_status(agent)).model_dump(mode="json")
+    def serialize_agent_event(cls, agent: Agent) -> str:
+        return dump_agent_event({"agent": cls.to_agent_read(cls.with_computed_status(agent))})
 
     async def fetch_agent_events(
         self,
@@ -1530,8 +1544,7 @@ class AgentLifecycleService(OpenClawDBService):
                 for agent in agents:
                     updated_at = agent.updated_at or agent.last_seen_at or utcnow()
                     last_seen = max(updated_at, last_seen)
-                    payload = {"agent": self.serialize_agent(agent)}
-                    yield {"event": "agent", "data": json.dumps(payload)}
+                    yield {"event": "agent", "data": self.serialize_agent_event(agent)}
                 await asyncio.sleep(2)
 
         return EventSourceResponse(event_generator(), ping=15)
@@ -1615,11 +1628,19 @@ class AgentLifecycleService(OpenClawDBService):
         )
         if not updates and not options.force and make_main is None:
             return self.to_agent_read(self.with_computed_status(agent))
+        gateway_neutral = (
+            make_main is None
+            and not options.force
+            and set(updates).issubset(_GATEWAY_NEUTRAL_UPDATE_FIELDS)
+        )
         main_gateway, gateway_for_main = await self.apply_agent_update_mutations(
             agent=agent,
             updates=updates,
             make_main=make_main,
         )
+        if gateway_neutral:
+            self.logger.info("agent.update.success agent_id=%s provision=skipped", agent.id)
+            return self.to_agent_read(self.with_computed_status(agent))
         target = await self.resolve_agent_update_target(
             agent=agent,
             make_main=make_main,
@@ -1820,23 +1841,16 @@ class AgentLifecycleService(OpenClawDBService):
             agent_id=None,
         )
         now = utcnow()
+        # One UPDATE covers both branches: in-progress tasks return to the
+        # inbox while other statuses keep their state, CASE picks per row.
+        in_progress = col(Task.status) == "in_progress"
         await crud.update_where(
             self.session,
             Task,
             col(Task.assigned_agent_id) == agent.id,
-            col(Task.status) == "in_progress",
-            assigned_agent_id=None,
-            status="inbox",
-            in_progress_at=None,
-            updated_at=now,
-            commit=False,
-        )
-        await crud.update_where(
-            self.session,
-            Task,
-            col(Task.assigned_agent_id) == agent.id,
-            col(Task.status) != "in_progress",
             assigned_agent_id=None,
+            status=case((in_progress, "inbox"), else_=col(Task.status)),
+            in_progress_at=case((in_progress, null()), else_=col(Task.in_progress_at)),
             updated_at=now,
             commit=False,
         )
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypedDict, cast
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -41,6 +42,18 @@ if TYPE_CHECKING:
     from app.models.users import User
 
 
+class SessionsListPayload(TypedDict, total=False):
+    """Dict shape of a ``sessions.list`` RPC response."""
+
+    sessions: list[object]
+
+
+class EnsuredSessionPayload(TypedDict, total=False):
+    """Dict shape of an ``ensure_session`` RPC response."""
+
+    entry: dict[str, object]
+
+
 @dataclass(frozen=True, slots=True)
 class GatewayTemplateSyncQuery:
     """Sync options parsed from query args for gateway template operations."""
@@ -57,6 +70,8 @@ class GatewayTemplateSyncQuery:
 class GatewaySessionService(OpenClawDBService):
     """Read/query gateway runtime session state for user-facing APIs."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
@@ -90,6 +105,24 @@ class GatewaySessionService(OpenClawDBService):
             return list(value)
         return []
 
+    @classmethod
+    def sessions_from_payload(cls, payload: object) -> list[object]:
+        """Normalize a ``sessions.list`` response into a list of entries.
+
+        Discriminates the dict-vs-list response shape once so callers do not
+        repeat the isinstance branching.
+        """
+        if isinstance(payload, dict):
+            payload = cast(SessionsListPayload, payload).get("sessions")
+        return cls.as_object_list(payload)
+
+    @staticmethod
+    def entry_from_ensured(ensured: object) -> dict[str, object] | None:
+        """Extract the session entry from an ``ensure_session`` response."""
+        if isinstance(ensured, dict):
+            return cast(EnsuredSessionPayload, ensured).get("entry") or ensured
+        return None
+
     async def resolve_gateway(
         self,
         params: GatewayResolveQuery,
@@ -158,10 +191,7 @@ class GatewaySessionService(OpenClawDBService):
 
     async def list_sessions(self, config: GatewayClientConfig) -> list[dict[str, object]]:
         sessions = await openclaw_call("sessions.list", config=config)
-        if isinstance(sessions, dict):
-            raw_items = self.as_object_list(sessions.get("sessions"))
-        else:
-            raw_items = self.as_object_list(sessions)
+        raw_items = self.sessions_from_payload(sessions)
         return [item for item in raw_items if isinstance(item, dict)]
 
     async def with_main_session(
@@ -211,24 +241,27 @@ class GatewaySessionService(OpenClawDBService):
                 error=compatibility.message,
             )
         try:
-            sessions = await openclaw_call("sessions.list", config=config)
-            if isinstance(sessions, dict):
-                sessions_list = self.as_object_list(sessions.get("sessions"))
-            else:
-                sessions_list = self.as_object_list(sessions)
             main_session_entry: object | None = None
             main_session_error: str | None = None
             if main_session:
-                try:
-                    ensured = await ensure_session(
-                        main_session,
-                        config=config,
-                        label="Gateway Agent",
-                    )
-                    if isinstance(ensured, dict):
-                        main_session_entry = ensured.get("entry") or ensured
-                except OpenClawGatewayError as exc:
-                    main_session_error = str(exc)
+                # sessions.list and the main-session ensure are independent
+                # gateway calls, so overlap them instead of paying two RTTs.
+                sessions, ensured = await asyncio.gather(
+                    openclaw_call("sessions.list", config=config),
+                    ensure_session(main_session, config=config, label="Gateway Agent"),
+                    return_exceptions=True,
+                )
+                if isinstance(sessions, BaseException):
+                    raise sessions
+                if isinstance(ensured, OpenClawGatewayError):
+                    main_session_error = str(ensured)
+                elif isinstance(ensured, BaseException):
+                    raise ensured
+                else:
+                    main_session_entry = self.entry_from_ensured(ensured)
+            else:
+                sessions = await openclaw_call("sessions.list", config=config)
+            sessions_list = self.sessions_from_payload(sessions)
             return GatewaysStatusResponse(
                 connected=True,
                 gateway_url=config.url,
@@ -254,30 +287,36 @@ class GatewaySessionService(OpenClawDBService):
         params = GatewayResolveQuery(board_id=board_id)
         board, config, main_session = await self.resolve_gateway(params, user=user)
         self._require_same_org(board, organization_id)
-        try:
-            sessions = await openclaw_call("sessions.list", config=config)
-        except OpenClawGatewayError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=str(exc),
-            ) from exc
-        if isinstance(sessions, dict):
-            sessions_list = self.as_object_list(sessions.get("sessions"))
-        else:
-            sessions_list = self.as_object_list(sessions)
-
         main_session_entry: object | None = None
         if main_session:
-            try:
-                ensured = await ensure_session(
-                    main_session,
-                    config=config,
-                    label="Gateway Agent",
-                )
-                if isinstance(ensured, dict):
-                    main_session_entry = ensured.get("entry") or ensured
-            except OpenClawGatewayError:
+            # Overlap the independent sessions.list and ensure_session calls.
+            sessions, ensured = await asyncio.gather(
+                openclaw_call("sessions.list", config=config),
+                ensure_session(main_session, config=config, label="Gateway Agent"),
+                return_exceptions=True,
+            )
+            if isinstance(sessions, OpenClawGatewayError):
+                raise HTTPException(
+                    status_code=status.HTTP_502_BAD_GATEWAY,
+                    detail=str(sessions),
+                ) from sessions
+            if isinstance(sessions, BaseException):
+                raise sessions
+            if isinstance(ensured, OpenClawGatewayError):
                 main_session_entry = None
+            elif isinstance(ensured, BaseException):
+                raise ensured
+            else:
+                main_session_entry = self.entry_from_ensured(ensured)
+        else:
+            try:
+                sessions = await openclaw_call("sessions.list", config=config)
+            except OpenClawGatewayError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_502_BAD_GATEWAY,
+                    detail=str(exc),
+                ) from exc
+        sessions_list = self.sessions_from_payload(sessions)
         return GatewaySessionsResponse(sessions=sessions_list, main_session=main_session_entry)
 
     async def get_session(
@@ -313,8 +352,7 @@ class GatewaySessionService(OpenClawDBService):
                     config=config,
                     label="Gateway Agent",
                 )
-                if isinstance(ensured, dict):
-                    session_entry = ensured.get("entry") or ensured
+                session_entry = self.entry_from_ensured(ensured)
             except OpenClawGatewayError:
                 session_entry = None
         if session_entry is None:
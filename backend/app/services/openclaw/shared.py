@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from uuid import UUID
 
 from app.models.gateways import Gateway
@@ -12,12 +13,24 @@ from app.services.openclaw.constants import (
 )
 
 
+# Both builders are pure functions of the gateway id and get called several
+# times per gateway on provisioning paths, so the composed strings are cached.
+@lru_cache(maxsize=4096)
+def _session_key_for_id(gateway_id: UUID) -> str:
+    return f"{_GATEWAY_AGENT_PREFIX}{gateway_id}{_GATEWAY_AGENT_SUFFIX}"
+
+
+@lru_cache(maxsize=4096)
+def _openclaw_agent_id_for_id(gateway_id: UUID) -> str:
+    return f"{_GATEWAY_OPENCLAW_AGENT_PREFIX}{gateway_id}"
+
+
 class GatewayAgentIdentity:
     """Naming and identity rules for Mission Control gateway-main agents."""
 
     @classmethod
     def session_key_for_id(cls, gateway_id: UUID) -> str:
-        return f"{_GATEWAY_AGENT_PREFIX}{gateway_id}{_GATEWAY_AGENT_SUFFIX}"
+        return _session_key_for_id(gateway_id)
 
     @classmethod
     def session_key(cls, gateway: Gateway) -> str:
@@ -25,7 +38,7 @@ class GatewayAgentIdentity:
 
     @classmethod
     def openclaw_agent_id_for_id(cls, gateway_id: UUID) -> str:
-        return f"{_GATEWAY_OPENCLAW_AGENT_PREFIX}{gateway_id}"
+        return _openclaw_agent_id_for_id(gateway_id)
 
     @classmethod
     def openclaw_agent_id(cls, gateway: Gateway) -> str:
@@ -213,17 +213,17 @@ async def accept_invite(
                 ),
             ),
         )
-        for row in access_rows:
-            session.add(
-                OrganizationBoardAccess(
-                    organization_member_id=member.id,
-                    board_id=row.board_id,
-                    can_read=row.can_read,
-                    can_write=row.can_write,
-                    created_at=now,
-                    updated_at=now,
-                ),
+        session.add_all(
+            OrganizationBoardAccess(
+                organization_member_id=member.id,
+                board_id=row.board_id,
+                can_read=row.can_read,
+                can_write=row.can_write,
+                created_at=now,
+                updated_at=now,
             )
+            for row in access_rows
+        )
 
     invite.accepted_by_user_id = user.id
     invite.accepted_at = now
@@ -592,15 +592,20 @@ async def apply_invite_to_member(
             ),
         ),
     )
-    for row in access_rows:
-        existing = (
-            await session.exec(
-                select(OrganizationBoardAccess).where(
-                    col(OrganizationBoardAccess.organization_member_id) == member.id,
-                    col(OrganizationBoardAccess.board_id) == row.board_id,
+    # One query for the member's current rows instead of a SELECT per invite row.
+    existing_by_board_id: dict[UUID, OrganizationBoardAccess] = {}
+    if access_rows:
+        existing_rows = await session.exec(
+            select(OrganizationBoardAccess).where(
+                col(OrganizationBoardAccess.organization_member_id) == member.id,
+                col(OrganizationBoardAccess.board_id).in_(
+                    [row.board_id for row in access_rows],
                 ),
-            )
-        ).first()
+            ),
+        )
+        existing_by_board_id = {access.board_id: access for access in existing_rows}
+    for row in access_rows:
+        existing = existing_by_board_id.get(row.board_id)
         can_write = bool(row.can_write)
         can_read = bool(row.can_read or row.can_write)
         if existing is None:
@@ -11,6 +11,7 @@ from typing import Any, cast
 import redis
 
 from app.core.config import settings
+from app.core.jsonio import json_loads
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -230,7 +231,7 @@ def _decode_task(raw: str | bytes, queue_name: str) -> QueuedTask:
         raw = raw.decode("utf-8")
 
     try:
-        payload: dict[str, Any] = json.loads(raw)
+        payload: dict[str, Any] = json_loads(raw)
         if "task_type" not in payload and "payload" not in payload:
             return QueuedTask(
                 task_type="legacy",
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -29,15 +29,9 @@ def slugify_tag(value: str) -> str:
     return slug or "tag"
 
 
-def _dedupe_uuid_list(values: Sequence[UUID]) -> list[UUID]:
-    deduped: list[UUID] = []
-    seen: set[UUID] = set()
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        deduped.append(value)
-    return deduped
+def _dedupe_uuid_list(values: Iterable[UUID]) -> list[UUID]:
+    # dict.fromkeys keeps first-seen order with one hash per value.
+    return list(dict.fromkeys(values))
 
 
 async def validate_tag_ids(
@@ -88,18 +82,16 @@ async def load_tag_state(
     if not normalized_task_ids:
         return {}
 
-    rows = list(
-        await session.exec(
-            select(
-                col(TagAssignment.task_id),
-                Tag,
-            )
-            .join(Tag, col(Tag.id) == col(TagAssignment.tag_id))
-            .where(col(TagAssignment.task_id).in_(normalized_task_ids))
-            .order_by(
-                col(TagAssignment.task_id).asc(),
-                col(TagAssignment.created_at).asc(),
-            ),
+    rows = await session.exec(
+        select(
+            col(TagAssignment.task_id),
+            Tag,
+        )
+        .join(Tag, col(Tag.id) == col(TagAssignment.tag_id))
+        .where(col(TagAssignment.task_id).in_(normalized_task_ids))
+        .order_by(
+            col(TagAssignment.task_id).asc(),
+            col(TagAssignment.created_at).asc(),
         ),
     )
     state_by_task_id: dict[UUID, TagState] = defaultdict(TagState)
@@ -132,8 +124,7 @@ async def replace_tags(
             col(TagAssignment.task_id) == task_id,
         ),
     )
-    for tag_id in normalized:
-        session.add(TagAssignment(task_id=task_id, tag_id=tag_id))
+    session.add_all(TagAssignment(task_id=task_id, tag_id=tag_id) for tag_id in normalized)
 
 
 async def task_counts_for_tags(
@@ -145,14 +136,12 @@ async def task_counts_for_tags(
     normalized = _dedupe_uuid_list(tag_ids)
     if not normalized:
         return {}
-    rows = list(
-        await session.exec(
-            select(
-                col(TagAssignment.tag_id),
-                func.count(col(TagAssignment.task_id)),
-            )
-            .where(col(TagAssignment.tag_id).in_(normalized))
-            .group_by(col(TagAssignment.tag_id)),
-        ),
+    rows = await session.exec(
+        select(
+            col(TagAssignment.tag_id),
+            func.count(col(TagAssignment.task_id)),
+        )
+        .where(col(TagAssignment.tag_id).in_(normalized))
+        .group_by(col(TagAssignment.tag_id)),
     )
     return {tag_id: int(count or 0) for tag_id, count in rows}
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Final
 from uuid import UUID
 
@@ -19,16 +19,9 @@ DONE_STATUS: Final[str] = "done"
 _RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession, Mapping, Sequence)
 
 
-def _dedupe_uuid_list(values: Sequence[UUID]) -> list[UUID]:
+def _dedupe_uuid_list(values: Iterable[UUID]) -> list[UUID]:
     # Preserve order; remove duplicates.
-    seen: set[UUID] = set()
-    output: list[UUID] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        output.append(value)
-    return output
+    return list(dict.fromkeys(values))
 
 
 async def dependency_ids_by_task_id(
@@ -40,13 +33,11 @@ async def dependency_ids_by_task_id(
     """Return dependency ids keyed by task id for tasks on a board."""
     if not task_ids:
         return {}
-    rows = list(
-        await session.exec(
-            select(col(TaskDependency.task_id), col(TaskDependency.depends_on_task_id))
-            .where(col(TaskDependency.board_id) == board_id)
-            .where(col(TaskDependency.task_id).in_(task_ids))
-            .order_by(col(TaskDependency.created_at).asc()),
-        ),
+    rows = await session.exec(
+        select(col(TaskDependency.task_id), col(TaskDependency.depends_on_task_id))
+        .where(col(TaskDependency.board_id) == board_id)
+        .where(col(TaskDependency.task_id).in_(task_ids))
+        .order_by(col(TaskDependency.created_at).asc()),
     )
     mapping: dict[UUID, list[UUID]] = defaultdict(list)
     for task_id, depends_on_task_id in rows:
@@ -63,14 +54,13 @@ async def dependency_status_by_id(
     """Return dependency status values keyed by dependency task id."""
     if not dependency_ids:
         return {}
-    rows = list(
-        await session.exec(
-            select(col(Task.id), col(Task.status))
-            .where(col(Task.board_id) == board_id)
-            .where(col(Task.id).in_(dependency_ids)),
-        ),
+    rows = await session.exec(
+        select(col(Task.id), col(Task.status))
+        .where(col(Task.board_id) == board_id)
+        .where(col(Task.id).in_(dependency_ids)),
     )
-    return dict(rows)
+    # dict(rows) would treat the Result as a mapping via its keys() method.
+    return {dependency_id: dep_status for dependency_id, dep_status in rows}
 
 
 def blocked_by_dependency_ids(
@@ -108,6 +98,9 @@ async def blocked_by_for_task(
     return blocked_by_dependency_ids(dependency_ids=dep_ids, status_by_id=status_by_id)
 
 
+_NO_EDGES: frozenset[UUID] = frozenset()
+
+
 def _has_cycle(nodes: Sequence[UUID], edges: Mapping[UUID, set[UUID]]) -> bool:
     """Detect cycles in a directed dependency graph."""
     visited: set[UUID] = set()
@@ -120,7 +113,9 @@ def _has_cycle(nodes: Sequence[UUID], edges: Mapping[UUID, set[UUID]]) -> bool:
             return False
         visited.add(current)
         in_stack.add(current)
-        for nxt in edges.get(current, set()):
+        # Shared empty default: edges.get(current, set()) would allocate a
+        # fresh set for every leaf node in the traversal.
+        for nxt in edges.get(current, _NO_EDGES):
             if dfs(nxt):
                 return True
         in_stack.remove(current)
@@ -171,13 +166,11 @@ async def validate_dependency_update(
             select(col(Task.id)).where(col(Task.board_id) == board_id),
         ),
     )
-    rows = list(
-        await session.exec(
-            select(
-                col(TaskDependency.task_id),
-                col(TaskDependency.depends_on_task_id),
-            ).where(col(TaskDependency.board_id) == board_id),
-        ),
+    rows = await session.exec(
+        select(
+            col(TaskDependency.task_id),
+            col(TaskDependency.depends_on_task_id),
+        ).where(col(TaskDependency.board_id) == board_id),
     )
     edges: dict[UUID, set[UUID]] = defaultdict(set)
     for src, dst in rows:
@@ -214,14 +207,14 @@ async def replace_task_dependencies(
         col(TaskDependency.task_id) == task_id,
         commit=False,
     )
-    for dep_id in normalized:
-        session.add(
-            TaskDependency(
-                board_id=board_id,
-                task_id=task_id,
-                depends_on_task_id=dep_id,
-            ),
+    session.add_all(
+        TaskDependency(
+            board_id=board_id,
+            task_id=task_id,
+            depends_on_task_id=dep_id,
         )
+        for dep_id in normalized
+    )
     return normalized
 
 
@@ -0,0 +1,32 @@
+"""add composite index for gateway listing
+
+Revision ID: a7c3f1d8b2e5
+Revises: e3a1b2c4d5f6
+Create Date: 2026-08-28 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a7c3f1d8b2e5"
+down_revision = "e3a1b2c4d5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Gateway listing filters by organization_id and orders by created_at
+    # (desc in code). The composite btree index supports a backward scan with
+    # LIMIT instead of sorting every org row per request.
+    op.create_index(
+        "ix_gateways_organization_id_created_at",
+        "gateways",
+        ["organization_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gateways_organization_id_created_at", table_name="gateways")
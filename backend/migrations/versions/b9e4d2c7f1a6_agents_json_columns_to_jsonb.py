@@ -0,0 +1,50 @@
+"""convert agents json columns to jsonb
+
+Revision ID: b9e4d2c7f1a6
+Revises: a7c3f1d8b2e5
+Create Date: 2026-08-28 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "b9e4d2c7f1a6"
+down_revision = "a7c3f1d8b2e5"
+branch_labels = None
+depends_on = None
+
+_JSON_COLUMNS = ("heartbeat_config", "identity_profile")
+
+
+def upgrade() -> None:
+    # JSONB stores parsed documents instead of re-parsing text per read and
+    # unlocks operator/GIN support if key filters are ever added. Non-Postgres
+    # backends keep the generic JSON type.
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    for column in _JSON_COLUMNS:
+        op.alter_column(
+            "agents",
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    for column in _JSON_COLUMNS:
+        op.alter_column(
+            "agents",
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
@@ -19,33 +19,38 @@ branch_labels = None
 depends_on = None
 
 
-def _has_table(table_name: str) -> bool:
-    return sa.inspect(op.get_bind()).has_table(table_name)
+# The helpers share one Inspector per upgrade/downgrade pass instead of
+# re-running sa.inspect(op.get_bind()) for every check; the Inspector caches
+# reflection queries, so callers must grab a fresh one (via _inspector) after
+# DDL that later checks depend on. Each helper snapshots one table's names as
+# a set so repeated checks are membership tests, not linear scans per check.
 
 
-def _has_column(table_name: str, column_name: str) -> bool:
-    if not _has_table(table_name):
-        return False
-    columns = sa.inspect(op.get_bind()).get_columns(table_name)
-    return any(column["name"] == column_name for column in columns)
+def _inspector() -> sa.Inspector:
+    return sa.inspect(op.get_bind())
 
 
-def _has_index(table_name: str, index_name: str) -> bool:
-    if not _has_table(table_name):
-        return False
-    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
-    return any(index["name"] == index_name for index in indexes)
+def _column_names(inspector: sa.Inspector, table_name: str) -> set[str]:
+    if not inspector.has_table(table_name):
+        return set()
+    return {column["name"] for column in inspector.get_columns(table_name)}
 
 
-def _has_constraint(table_name: str, constraint_name: str) -> bool:
-    if not _has_table(table_name):
-        return False
-    constraints = sa.inspect(op.get_bind()).get_check_constraints(table_name)
-    return any(constraint["name"] == constraint_name for constraint in constraints)
+def _index_names(inspector: sa.Inspector, table_name: str) -> set[str | None]:
+    if not inspector.has_table(table_name):
+        return set()
+    return {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def _check_constraint_names(inspector: sa.Inspector, table_name: str) -> set[str | None]:
+    if not inspector.has_table(table_name):
+        return set()
+    return {constraint["name"] for constraint in inspector.get_check_constraints(table_name)}
 
 
 def upgrade() -> None:
-    if not _has_table("marketplace_skills"):
+    inspector = _inspector()
+    if not inspector.has_table("marketplace_skills"):
         op.create_table(
             "marketplace_skills",
             sa.Column("id", sa.Uuid(), nullable=False),
@@ -75,7 +80,9 @@ def upgrade() -> None:
                 name="uq_marketplace_skills_org_source_url",
             ),
         )
-    if not _has_column("marketplace_skills", "metadata"):
+        inspector = _inspector()
+    marketplace_columns = _column_names(inspector, "marketplace_skills")
+    if "metadata" not in marketplace_columns:
         op.add_column(
             "marketplace_skills",
             sa.Column(
@@ -85,17 +92,15 @@ def upgrade() -> None:
                 server_default=sa.text("'{}'"),
             ),
         )
-    if _has_column("marketplace_skills", "resolution_metadata") and not _has_column(
-        "marketplace_skills", "metadata",
-    ):
+        inspector = _inspector()
+        marketplace_columns = _column_names(inspector, "marketplace_skills")
+    if "resolution_metadata" in marketplace_columns and "metadata" not in marketplace_columns:
         op.execute(
             sa.text(
                 "UPDATE marketplace_skills SET metadata = resolution_metadata WHERE resolution_metadata IS NOT NULL"
             )
         )
-    elif _has_column("marketplace_skills", "path_metadata") and not _has_column(
-        "marketplace_skills", "metadata"
-    ):
+    elif "path_metadata" in marketplace_columns and "metadata" not in marketplace_columns:
         op.execute(
             sa.text(
                 "UPDATE marketplace_skills SET metadata = path_metadata WHERE path_metadata IS NOT NULL"
@@ -103,7 +108,7 @@ def upgrade() -> None:
         )
 
     marketplace_org_idx = op.f("ix_marketplace_skills_organization_id")
-    if not _has_index("marketplace_skills", marketplace_org_idx):
+    if marketplace_org_idx not in _index_names(inspector, "marketplace_skills"):
         op.create_index(
             marketplace_org_idx,
             "marketplace_skills",
@@ -111,7 +116,7 @@ def upgrade() -> None:
             unique=False,
         )
 
-    if not _has_table("gateway_installed_skills"):
+    if not inspector.has_table("gateway_installed_skills"):
         op.create_table(
             "gateway_installed_skills",
             sa.Column("id", sa.Uuid(), nullable=False),
@@ -135,9 +140,11 @@ def upgrade() -> None:
                 name="uq_gateway_installed_skills_gateway_id_skill_id",
             ),
         )
+        inspector = _inspector()
 
+    installed_skill_indexes = _index_names(inspector, "gateway_installed_skills")
     gateway_id_idx = op.f("ix_gateway_installed_skills_gateway_id")
-    if not _has_index("gateway_installed_skills", gateway_id_idx):
+    if gateway_id_idx not in installed_skill_indexes:
         op.create_index(
             gateway_id_idx,
             "gateway_installed_skills",
@@ -146,7 +153,7 @@ def upgrade() -> None:
         )
 
     gateway_skill_idx = op.f("ix_gateway_installed_skills_skill_id")
-    if not _has_index("gateway_installed_skills", gateway_skill_idx):
+    if gateway_skill_idx not in installed_skill_indexes:
         op.create_index(
             gateway_skill_idx,
             "gateway_installed_skills",
@@ -154,7 +161,7 @@ def upgrade() -> None:
             unique=False,
         )
 
-    if not _has_table("skill_packs"):
+    if not inspector.has_table("skill_packs"):
         op.create_table(
             "skill_packs",
             sa.Column("id", sa.Uuid(), nullable=False),
@@ -187,16 +194,15 @@ def upgrade() -> None:
                 name="uq_skill_packs_org_source_url",
             ),
         )
-    if not _has_constraint(
-        "skill_packs",
-        "ck_skill_packs_source_url_github",
-    ):
+        inspector = _inspector()
+    if "ck_skill_packs_source_url_github" not in _check_constraint_names(inspector, "skill_packs"):
         op.create_check_constraint(
             "ck_skill_packs_source_url_github",
             "skill_packs",
             "source_url LIKE 'https://github.com/%/%'",
         )
-    if not _has_column("skill_packs", "branch"):
+    skill_pack_columns = _column_names(inspector, "skill_packs")
+    if "branch" not in skill_pack_columns:
         op.add_column(
             "skill_packs",
             sa.Column(
@@ -206,7 +212,9 @@ def upgrade() -> None:
                 server_default=sa.text("'main'"),
             ),
         )
-    if not _has_column("skill_packs", "metadata"):
+        inspector = _inspector()
+        skill_pack_columns = _column_names(inspector, "skill_packs")
+    if "metadata" not in skill_pack_columns:
         op.add_column(
             "skill_packs",
             sa.Column(
@@ -216,17 +224,15 @@ def upgrade() -> None:
                 server_default=sa.text("'{}'"),
             ),
         )
-    if _has_column("skill_packs", "resolution_metadata") and not _has_column(
-        "skill_packs", "metadata"
-    ):
+        inspector = _inspector()
+        skill_pack_columns = _column_names(inspector, "skill_packs")
+    if "resolution_metadata" in skill_pack_columns and "metadata" not in skill_pack_columns:
         op.execute(
             sa.text(
                 "UPDATE skill_packs SET metadata = resolution_metadata WHERE resolution_metadata IS NOT NULL"
             )
         )
-    elif _has_column("skill_packs", "path_metadata") and not _has_column(
-        "skill_packs", "metadata"
-    ):
+    elif "path_metadata" in skill_pack_columns and "metadata" not in skill_pack_columns:
         op.execute(
             sa.text(
                 "UPDATE skill_packs SET metadata = path_metadata WHERE path_metadata IS NOT NULL"
@@ -234,7 +240,7 @@ def upgrade() -> None:
         )
 
     skill_packs_org_idx = op.f("ix_skill_packs_organization_id")
-    if not _has_index("skill_packs", skill_packs_org_idx):
+    if skill_packs_org_idx not in _index_names(inspector, "skill_packs"):
         op.create_index(
             skill_packs_org_idx,
             "skill_packs",
@@ -244,8 +250,10 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
+    # Drops never re-check an object they removed, so one snapshot is enough.
+    inspector = _inspector()
     skill_pack_github_constraint = "ck_skill_packs_source_url_github"
-    if _has_constraint("skill_packs", skill_pack_github_constraint):
+    if skill_pack_github_constraint in _check_constraint_names(inspector, "skill_packs"):
         op.drop_constraint(
             skill_pack_github_constraint,
             "skill_packs",
@@ -253,38 +261,39 @@ def downgrade() -> None:
         )
 
     skill_packs_org_idx = op.f("ix_skill_packs_organization_id")
-    if _has_index("skill_packs", skill_packs_org_idx):
+    if skill_packs_org_idx in _index_names(inspector, "skill_packs"):
         op.drop_index(
             skill_packs_org_idx,
             table_name="skill_packs",
         )
 
-    if _has_table("skill_packs"):
+    if inspector.has_table("skill_packs"):
         op.drop_table("skill_packs")
 
+    installed_skill_indexes = _index_names(inspector, "gateway_installed_skills")
     gateway_skill_idx = op.f("ix_gateway_installed_skills_skill_id")
-    if _has_index("gateway_installed_skills", gateway_skill_idx):
+    if gateway_skill_idx in installed_skill_indexes:
         op.drop_index(
             gateway_skill_idx,
             table_name="gateway_installed_skills",
         )
 
     gateway_id_idx = op.f("ix_gateway_installed_skills_gateway_id")
-    if _has_index("gateway_installed_skills", gateway_id_idx):
+    if gateway_id_idx in installed_skill_indexes:
         op.drop_index(
             gateway_id_idx,
             table_name="gateway_installed_skills",
         )
 
-    if _has_table("gateway_installed_skills"):
+    if inspector.has_table("gateway_installed_skills"):
         op.drop_table("gateway_installed_skills")
 
     marketplace_org_idx = op.f("ix_marketplace_skills_organization_id")
-    if _has_index("marketplace_skills", marketplace_org_idx):
+    if marketplace_org_idx in _index_names(inspector, "marketplace_skills"):
         op.drop_index(
             marketplace_org_idx,
             table_name="marketplace_skills",
         )
 
-    if _has_table("marketplace_skills"):
+    if inspector.has_table("marketplace_skills"):
         op.drop_table("marketplace_skills")
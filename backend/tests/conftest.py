@@ -1,14 +1,39 @@
 # ruff: noqa: INP001
 """Pytest configuration shared across backend tests."""
 
+import ast
 import os
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+
+@pytest.fixture(scope="session")
+def api_py_imports() -> list[tuple[Path, list[ast.Import | ast.ImportFrom]]]:
+    """Parse `backend/app/api` once per session and keep each file's import nodes.
+
+    AST nodes carry line numbers and see multi-line `from ... import (...)`
+    forms that a per-line string scan misses. Shared here so any
+    boundary-style test can reuse the same cached walk; it stays lazy, so
+    sessions that deselect those tests never pay for it.
+    """
+    repo_root = ROOT.parent
+    api_root = ROOT / "app" / "api"
+    files: list[tuple[Path, list[ast.Import | ast.ImportFrom]]] = []
+    for path in api_root.rglob("*.py"):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        imports = [
+            node for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+        ]
+        files.append((path.relative_to(repo_root), imports))
+    return files
+
+
 # Tests should fail fast if auth-mode wiring breaks, but still need deterministic
 # defaults during import-time settings initialization, regardless of shell env.
 os.environ["AUTH_MODE"] = "local"
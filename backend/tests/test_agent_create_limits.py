@@ -44,7 +44,9 @@ async def test_create_agent_as_lead_enforces_board_max_agents(
     board = _BoardStub(id=board_id, gateway_id=uuid4(), max_agents=1)
     lead = _AgentStub(id=uuid4(), board_id=board_id, is_board_lead=True)
     actor = SimpleNamespace(actor_type="agent", user=None, agent=lead)
-    payload = AgentCreate(name="Worker Agent", board_id=board_id)
+    # model_validate takes pydantic's fast dict path; keyword construction
+    # goes through the synthesized __init__ first.
+    payload = AgentCreate.model_validate({"name": "Worker Agent", "board_id": board_id})
 
     async def _fake_require_board(*_args: object, **_kwargs: object) -> _BoardStub:
         return board
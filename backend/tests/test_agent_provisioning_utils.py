@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from types import SimpleNamespace
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
 from uuid import UUID, uuid4
 
 import pytest
@@ -28,13 +28,18 @@ def test_slugify_falls_back_to_uuid_hex(monkeypatch):
     assert agent_provisioning.slugify("!!!") == "deadbeef"
 
 
-@dataclass
+# No test in this module relies on distinct stub ids, so share one fixed UUID
+# instead of reading OS entropy per construction.
+_STUB_AGENT_ID = UUID(int=0)
+
+
+@dataclass(slots=True)
 class _AgentStub:
     name: str
     openclaw_session_id: str | None = None
     heartbeat_config: dict | None = None
     is_board_lead: bool = False
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = _STUB_AGENT_ID
     identity_profile: dict | None = None
     identity_template: str | None = None
     soul_template: str | None = None
@@ -112,7 +117,18 @@ def test_user_context_prefers_name_token_when_preferred_name_missing():
     assert context["user_preferred_name"] == "Jane"
 
 
-@dataclass
+@pytest.fixture(scope="session")
+def workspace_root(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Workspace root for gateway stubs.
+
+    The provisioner only treats this as an opaque string, but a per-session
+    temp directory keeps parallel (xdist) workers from sharing one literal
+    /tmp path.
+    """
+    return str(tmp_path_factory.mktemp("openclaw-ws"))
+
+
+@dataclass(slots=True)
 class _GatewayStub:
     id: UUID
     name: str
@@ -123,8 +139,42 @@ class _GatewayStub:
     disable_device_pairing: bool = False
 
 
-@pytest.mark.asyncio
-async def test_provision_main_agent_uses_dedicated_openclaw_agent_id(monkeypatch):
+# Shared stubs for lifecycle tests: the noops never change, so they are
+# defined once at module scope instead of per test invocation.
+async def _noop_async(*args, **kwargs):
+    return None
+
+
+def _empty_render(*args, **kwargs):
+    return {}
+
+
+def _install_lifecycle_stubs(monkeypatch, captured: dict[str, object]) -> None:
+    """Patch the gateway control plane to capture calls without any RPCs."""
+
+    async def _capture_upsert_agent(self, registration):
+        captured["patched_agent_id"] = registration.agent_id
+        captured["workspace_path"] = registration.workspace_path
+
+    async def _capture_list_agent_files(self, agent_id):
+        captured["files_index_agent_id"] = agent_id
+        return {}
+
+    control_plane = agent_provisioning.OpenClawGatewayControlPlane
+    for target, name, fn in (
+        (control_plane, "ensure_agent_session", _noop_async),
+        (control_plane, "upsert_agent", _capture_upsert_agent),
+        (control_plane, "list_agent_files", _capture_list_agent_files),
+        (agent_provisioning, "_render_agent_files", _empty_render),
+        (agent_provisioning.BaseAgentLifecycleManager, "_set_agent_files", _noop_async),
+    ):
+        monkeypatch.setattr(target, name, fn)
+
+
+# The async tests in this module hold no loop-bound resources, so they share
+# one session-scoped loop instead of paying per-test loop setup/teardown.
+@pytest.mark.asyncio(loop_scope="session")
+async def test_provision_main_agent_uses_dedicated_openclaw_agent_id(monkeypatch, workspace_root):
     gateway_id = uuid4()
     session_key = GatewayAgentIdentity.session_key_for_id(gateway_id)
     gateway = _GatewayStub(
@@ -132,49 +182,11 @@ async def test_provision_main_agent_uses_dedicated_openclaw_agent_id(monkeypatch
         name="Acme",
         url="ws://gateway.example/ws",
         token=None,
-        workspace_root="/tmp/openclaw",
+        workspace_root=workspace_root,
     )
     agent = _AgentStub(name="Acme Gateway Agent", openclaw_session_id=session_key)
     captured: dict[str, object] = {}
-
-    async def _fake_ensure_agent_session(self, session_key, *, label=None):
-        return None
-
-    async def _fake_upsert_agent(self, registration):
-        captured["patched_agent_id"] = registration.agent_id
-        captured["workspace_path"] = registration.workspace_path
-
-    async def _fake_list_agent_files(self, agent_id):
-        captured["files_index_agent_id"] = agent_id
-        return {}
-
-    def _fake_render_agent_files(*args, **kwargs):
-        return {}
-
-    async def _fake_set_agent_files(self, **kwargs):
-        return None
-
-    monkeypatch.setattr(
-        agent_provisioning.OpenClawGatewayControlPlane,
-        "ensure_agent_session",
-        _fake_ensure_agent_session,
-    )
-    monkeypatch.setattr(
-        agent_provisioning.OpenClawGatewayControlPlane,
-        "upsert_agent",
-        _fake_upsert_agent,
-    )
-    monkeypatch.setattr(
-        agent_provisioning.OpenClawGatewayControlPlane,
-        "list_agent_files",
-        _fake_list_agent_files,
-    )
-    monkeypatch.setattr(agent_provisioning, "_render_agent_files", _fake_render_agent_files)
-    monkeypatch.setattr(
-        agent_provisioning.BaseAgentLifecycleManager,
-        "_set_agent_files",
-        _fake_set_agent_files,
-    )
+    _install_lifecycle_stubs(monkeypatch, captured)
 
     await agent_provisioning.OpenClawGatewayProvisioner().apply_agent_lifecycle(
         agent=agent,  # type: ignore[arg-type]
@@ -191,134 +203,85 @@ async def test_provision_main_agent_uses_dedicated_openclaw_agent_id(monkeypatch
     assert captured["files_index_agent_id"] == expected_agent_id
 
 
-@pytest.mark.asyncio
-async def test_provision_overwrites_user_md_on_first_provision(monkeypatch):
-    """Gateway may pre-create USER.md; we still want MC's template on first provision."""
+# One control-plane stub for the _set_agent_files tests below; defining it per
+# test rebuilt the same class (and its eight method objects) on every run.
+class _ControlPlaneStub:
+    def __init__(self, files: dict[str, dict] | None = None):
+        self.writes: list[tuple[str, str]] = []
+        self._files = files or {}
 
-    class _ControlPlaneStub:
-        def __init__(self):
-            self.writes: list[tuple[str, str]] = []
+    async def ensure_agent_session(self, session_key, *, label=None):
+        return None
+
+    async def reset_agent_session(self, session_key):
+        return None
 
-        async def ensure_agent_session(self, session_key, *, label=None):
-            return None
+    async def delete_agent_session(self, session_key):
+        return None
 
-        async def reset_agent_session(self, session_key):
-            return None
+    async def upsert_agent(self, registration):
+        return None
 
-        async def delete_agent_session(self, session_key):
-            return None
+    async def delete_agent(self, agent_id, *, delete_files=True):
+        return None
 
-        async def upsert_agent(self, registration):
-            return None
+    async def list_agent_files(self, agent_id):
+        return self._files
 
-        async def delete_agent(self, agent_id, *, delete_files=True):
-            return None
+    async def set_agent_file(self, *, agent_id, name, content):
+        self.writes.append((name, content))
 
-        async def list_agent_files(self, agent_id):
-            # Pretend gateway created USER.md already.
-            return {"USER.md": {"name": "USER.md", "missing": False}}
+    async def patch_agent_heartbeats(self, entries):
+        return None
 
-        async def set_agent_file(self, *, agent_id, name, content):
-            self.writes.append((name, content))
 
-        async def patch_agent_heartbeats(self, entries):
-            return None
+class _Manager(agent_provisioning.BaseAgentLifecycleManager):
+    def _agent_id(self, agent):
+        return "agent-x"
+
+    def _build_context(self, *, agent, auth_token, user, board):
+        return {}
 
-    @dataclass
-    class _GatewayTiny:
-        id: UUID
-        name: str
-        url: str
-        token: str | None
-        workspace_root: str
-        allow_insecure_tls: bool = False
-        disable_device_pairing: bool = False
 
-    class _Manager(agent_provisioning.BaseAgentLifecycleManager):
-        def _agent_id(self, agent):
-            return "agent-x"
+# Shared read-only payload for the USER.md preservation tests; _set_agent_files
+# never mutates existing_files, so one literal serves every case.
+_USER_MD_PRESENT: dict[str, dict] = {"USER.md": {"name": "USER.md", "missing": False}}
 
-        def _build_context(self, *, agent, auth_token, user, board):
-            return {}
 
-    gateway = _GatewayTiny(
+def _file_manager(
+    workspace_root: str,
+    files: dict[str, dict] | None = None,
+) -> tuple[_Manager, _ControlPlaneStub]:
+    gateway = _GatewayStub(
         id=uuid4(),
         name="G",
         url="ws://x",
         token=None,
-        workspace_root="/tmp",
+        workspace_root=workspace_root,
     )
-    cp = _ControlPlaneStub()
-    mgr = _Manager(gateway, cp)  # type: ignore[arg-type]
+    cp = _ControlPlaneStub(files)
+    return _Manager(gateway, cp), cp  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_provision_overwrites_user_md_on_first_provision(workspace_root):
+    """Gateway may pre-create USER.md; we still want MC's template on first provision."""
+    mgr, cp = _file_manager(workspace_root, _USER_MD_PRESENT)
 
     # Rendered content is non-empty; action is "provision" so we should overwrite.
     await mgr._set_agent_files(
         agent_id="agent-x",
         rendered={"USER.md": "from-mc"},
-        existing_files={"USER.md": {"name": "USER.md", "missing": False}},
+        existing_files=_USER_MD_PRESENT,
         action="provision",
     )
     assert ("USER.md", "from-mc") in cp.writes
 
 
-@pytest.mark.asyncio
-async def test_set_agent_files_update_preserves_user_md_even_when_size_zero():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_set_agent_files_update_preserves_user_md_even_when_size_zero(workspace_root):
     """Update should preserve editable files unless overwrite is explicitly requested."""
-
-    class _ControlPlaneStub:
-        def __init__(self):
-            self.writes: list[tuple[str, str]] = []
-
-        async def ensure_agent_session(self, session_key, *, label=None):
-            return None
-
-        async def reset_agent_session(self, session_key):
-            return None
-
-        async def delete_agent_session(self, session_key):
-            return None
-
-        async def upsert_agent(self, registration):
-            return None
-
-        async def delete_agent(self, agent_id, *, delete_files=True):
-            return None
-
-        async def list_agent_files(self, agent_id):
-            return {}
-
-        async def set_agent_file(self, *, agent_id, name, content):
-            self.writes.append((name, content))
-
-        async def patch_agent_heartbeats(self, entries):
-            return None
-
-    @dataclass
-    class _GatewayTiny:
-        id: UUID
-        name: str
-        url: str
-        token: str | None
-        workspace_root: str
-        allow_insecure_tls: bool = False
-        disable_device_pairing: bool = False
-
-    class _Manager(agent_provisioning.BaseAgentLifecycleManager):
-        def _agent_id(self, agent):
-            return "agent-x"
-
-        def _build_context(self, *, agent, auth_token, user, board):
-            return {}
-
-    gateway = _GatewayTiny(
-        id=uuid4(),
-        name="G",
-        url="ws://x",
-        token=None,
-        workspace_root="/tmp",
-    )
-    cp = _ControlPlaneStub()
-    mgr = _Manager(gateway, cp)  # type: ignore[arg-type]
+    mgr, cp = _file_manager(workspace_root)
 
     await mgr._set_agent_files(
         agent_id="agent-x",
@@ -329,154 +292,53 @@ async def test_set_agent_files_update_preserves_user_md_even_when_size_zero():
     assert cp.writes == []
 
 
-@pytest.mark.asyncio
-async def test_set_agent_files_update_preserves_nonmissing_user_md():
-    class _ControlPlaneStub:
-        def __init__(self):
-            self.writes: list[tuple[str, str]] = []
-
-        async def ensure_agent_session(self, session_key, *, label=None):
-            return None
-
-        async def reset_agent_session(self, session_key):
-            return None
-
-        async def delete_agent_session(self, session_key):
-            return None
-
-        async def upsert_agent(self, registration):
-            return None
-
-        async def delete_agent(self, agent_id, *, delete_files=True):
-            return None
-
-        async def list_agent_files(self, agent_id):
-            return {}
-
-        async def set_agent_file(self, *, agent_id, name, content):
-            self.writes.append((name, content))
-
-        async def patch_agent_heartbeats(self, entries):
-            return None
-
-    @dataclass
-    class _GatewayTiny:
-        id: UUID
-        name: str
-        url: str
-        token: str | None
-        workspace_root: str
-        allow_insecure_tls: bool = False
-        disable_device_pairing: bool = False
-
-    class _Manager(agent_provisioning.BaseAgentLifecycleManager):
-        def _agent_id(self, agent):
-            return "agent-x"
-
-        def _build_context(self, *, agent, auth_token, user, board):
-            return {}
-
-    gateway = _GatewayTiny(
-        id=uuid4(),
-        name="G",
-        url="ws://x",
-        token=None,
-        workspace_root="/tmp",
-    )
-    cp = _ControlPlaneStub()
-    mgr = _Manager(gateway, cp)  # type: ignore[arg-type]
+@pytest.mark.asyncio(loop_scope="session")
+async def test_set_agent_files_update_preserves_nonmissing_user_md(workspace_root):
+    mgr, cp = _file_manager(workspace_root)
 
     await mgr._set_agent_files(
         agent_id="agent-x",
         rendered={"USER.md": "filled"},
-        existing_files={"USER.md": {"name": "USER.md", "missing": False}},
+        existing_files=_USER_MD_PRESENT,
         action="update",
     )
     assert cp.writes == []
 
 
-@pytest.mark.asyncio
-async def test_set_agent_files_update_overwrite_writes_preserved_user_md():
-    class _ControlPlaneStub:
-        def __init__(self):
-            self.writes: list[tuple[str, str]] = []
-
-        async def ensure_agent_session(self, session_key, *, label=None):
-            return None
-
-        async def reset_agent_session(self, session_key):
-            return None
-
-        async def delete_agent_session(self, session_key):
-            return None
-
-        async def upsert_agent(self, registration):
-            return None
-
-        async def delete_agent(self, agent_id, *, delete_files=True):
-            return None
-
-        async def list_agent_files(self, agent_id):
-            return {}
-
-        async def set_agent_file(self, *, agent_id, name, content):
-            self.writes.append((name, content))
-
-        async def patch_agent_heartbeats(self, entries):
-            return None
-
-    @dataclass
-    class _GatewayTiny:
-        id: UUID
-        name: str
-        url: str
-        token: str | None
-        workspace_root: str
-        allow_insecure_tls: bool = False
-        disable_device_pairing: bool = False
-
-    class _Manager(agent_provisioning.BaseAgentLifecycleManager):
-        def _agent_id(self, agent):
-            return "agent-x"
-
-        def _build_context(self, *, agent, auth_token, user, board):
-            return {}
-
-    gateway = _GatewayTiny(
-        id=uuid4(),
-        name="G",
-        url="ws://x",
-        token=None,
-        workspace_root="/tmp",
-    )
-    cp = _ControlPlaneStub()
-    mgr = _Manager(gateway, cp)  # type: ignore[arg-type]
+@pytest.mark.asyncio(loop_scope="session")
+async def test_set_agent_files_update_overwrite_writes_preserved_user_md(workspace_root):
+    mgr, cp = _file_manager(workspace_root)
 
     await mgr._set_agent_files(
         agent_id="agent-x",
         rendered={"USER.md": "filled"},
-        existing_files={"USER.md": {"name": "USER.md", "missing": False}},
+        existing_files=_USER_MD_PRESENT,
         action="update",
         overwrite=True,
     )
     assert ("USER.md", "filled") in cp.writes
 
 
-@pytest.mark.asyncio
+# Shared read-only gateway responses for the upsert tests; the control plane
+# copies entries before editing them, so one payload serves every case. The
+# config.get response stays a plain dict because _gateway_config_agent_list
+# isinstance-checks it; the proxy would surface accidental mutation as a
+# TypeError.
+_OK_RESPONSE = MappingProxyType({"ok": True})
+_EMPTY_AGENTS_CONFIG: dict[str, object] = {"hash": None, "config": {"agents": {"list": []}}}
+
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_control_plane_upsert_agent_create_then_update(monkeypatch):
     calls: list[tuple[str, dict[str, object] | None]] = []
 
     async def _fake_openclaw_call(method, params=None, config=None):
         _ = config
         calls.append((method, params))
-        if method == "agents.create":
-            return {"ok": True}
-        if method == "agents.update":
-            return {"ok": True}
+        if method in {"agents.create", "agents.update", "config.patch"}:
+            return _OK_RESPONSE
         if method == "config.get":
-            return {"hash": None, "config": {"agents": {"list": []}}}
-        if method == "config.patch":
-            return {"ok": True}
+            return _EMPTY_AGENTS_CONFIG
         raise AssertionError(f"Unexpected method: {method}")
 
     monkeypatch.setattr(agent_provisioning, "openclaw_call", _fake_openclaw_call)
@@ -496,7 +358,7 @@ async def test_control_plane_upsert_agent_create_then_update(monkeypatch):
     assert calls[1][0] == "agents.update"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_control_plane_upsert_agent_handles_already_exists(monkeypatch):
     calls: list[tuple[str, dict[str, object] | None]] = []
 
@@ -505,12 +367,10 @@ async def test_control_plane_upsert_agent_handles_already_exists(monkeypatch):
         calls.append((method, params))
         if method == "agents.create":
             raise agent_provisioning.OpenClawGatewayError("already exists")
-        if method == "agents.update":
-            return {"ok": True}
+        if method in {"agents.update", "config.patch"}:
+            return _OK_RESPONSE
         if method == "config.get":
-            return {"hash": None, "config": {"agents": {"list": []}}}
-        if method == "config.patch":
-            return {"ok": True}
+            return _EMPTY_AGENTS_CONFIG
         raise AssertionError(f"Unexpected method: {method}")
 
     monkeypatch.setattr(agent_provisioning, "openclaw_call", _fake_openclaw_call)
@@ -552,7 +412,7 @@ def test_select_role_soul_ref_prefers_exact_slug() -> None:
     assert selected.slug == "security-auditor"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_resolve_role_soul_markdown_returns_best_effort(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -584,7 +444,7 @@ async def test_resolve_role_soul_markdown_returns_best_effort(
     assert source_url == "https://souls.directory/souls/team/data-scientist"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_resolve_role_soul_markdown_returns_empty_on_directory_error(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -603,8 +463,10 @@ async def test_resolve_role_soul_markdown_returns_empty_on_directory_error(
     assert source_url == ""
 
 
-@pytest.mark.asyncio
-async def test_delete_agent_lifecycle_ignores_missing_gateway_agent(monkeypatch) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delete_agent_lifecycle_ignores_missing_gateway_agent(
+    monkeypatch, workspace_root
+) -> None:
     class _ControlPlaneStub:
         def __init__(self) -> None:
             self.deleted_sessions: list[str] = []
@@ -621,7 +483,7 @@ async def test_delete_agent_lifecycle_ignores_missing_gateway_agent(monkeypatch)
         name="Acme",
         url="ws://gateway.example/ws",
         token=None,
-        workspace_root="/tmp/openclaw",
+        workspace_root=workspace_root,
     )
     agent = SimpleNamespace(
         id=uuid4(),
@@ -643,8 +505,10 @@ async def test_delete_agent_lifecycle_ignores_missing_gateway_agent(monkeypatch)
     assert len(control_plane.deleted_sessions) == 1
 
 
-@pytest.mark.asyncio
-async def test_delete_agent_lifecycle_raises_on_non_missing_agent_error(monkeypatch) -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delete_agent_lifecycle_raises_on_non_missing_agent_error(
+    monkeypatch, workspace_root
+) -> None:
     class _ControlPlaneStub:
         async def delete_agent(self, agent_id: str, *, delete_files: bool = True) -> None:
             _ = (agent_id, delete_files)
@@ -659,7 +523,7 @@ async def test_delete_agent_lifecycle_raises_on_non_missing_agent_error(monkeypa
         name="Acme",
         url="ws://gateway.example/ws",
         token=None,
-        workspace_root="/tmp/openclaw",
+        workspace_root=workspace_root,
     )
     agent = SimpleNamespace(
         id=uuid4(),
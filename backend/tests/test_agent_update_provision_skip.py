@@ -0,0 +1,118 @@
+# ruff: noqa: S101
+"""Unit tests for the gateway-neutral agent update fast path."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+import app.services.openclaw.provisioning_db as agent_service
+from app.schemas.agents import AgentUpdate
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.committed = 0
+
+    def add(self, value: object) -> None:
+        del value
+
+    async def commit(self) -> None:
+        self.committed += 1
+
+    async def refresh(self, value: object) -> None:
+        del value
+
+
+class _FakeAgentObjects:
+    def __init__(self, agent: object) -> None:
+        self._agent = agent
+
+    def by_id(self, agent_id: str) -> _FakeAgentObjects:
+        del agent_id
+        return self
+
+    async def first(self, session: object) -> object:
+        del session
+        return self._agent
+
+
+async def _noop_async(*args: object, **kwargs: object) -> None:
+    return None
+
+
+def _prepare_service(
+    monkeypatch: pytest.MonkeyPatch, agent: SimpleNamespace
+) -> tuple[agent_service.AgentLifecycleService, list[object]]:
+    """Build a lifecycle service whose DB and gateway collaborators are stubbed."""
+    service = agent_service.AgentLifecycleService(_FakeSession())  # type: ignore[arg-type]
+    provisioned: list[object] = []
+
+    async def _apply_mutations(*, agent: SimpleNamespace, updates: dict, make_main: object):
+        for key, value in updates.items():
+            setattr(agent, key, value)
+        return None, None
+
+    async def _resolve_target(**_kwargs: object) -> SimpleNamespace:
+        return SimpleNamespace(is_main_agent=False, board=None, gateway=SimpleNamespace())
+
+    async def _provision(*, agent: object, request: object) -> None:
+        del agent
+        provisioned.append(request)
+
+    monkeypatch.setattr(agent_service.Agent, "objects", _FakeAgentObjects(agent))
+    monkeypatch.setattr(service, "require_agent_access", _noop_async)
+    monkeypatch.setattr(service, "validate_agent_update_inputs", _noop_async)
+    monkeypatch.setattr(service, "apply_agent_update_mutations", _apply_mutations)
+    monkeypatch.setattr(service, "resolve_agent_update_target", _resolve_target)
+    monkeypatch.setattr(service, "mark_agent_update_pending", lambda _agent: "raw-token")
+    monkeypatch.setattr(service, "provision_updated_agent", _provision)
+    monkeypatch.setattr(service, "with_computed_status", lambda agent: agent)
+    monkeypatch.setattr(service, "to_agent_read", lambda agent: agent)
+    return service, provisioned
+
+
+def _options() -> agent_service.AgentUpdateOptions:
+    return agent_service.AgentUpdateOptions(
+        force=False,
+        user=None,
+        context=SimpleNamespace(),  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_status_only_update_skips_gateway_provisioning(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent = SimpleNamespace(id=uuid4(), status="active", heartbeat_config=None)
+    service, provisioned = _prepare_service(monkeypatch, agent)
+
+    result = await service.update_agent(
+        agent_id=str(agent.id),
+        payload=AgentUpdate.model_validate({"status": "paused"}),
+        options=_options(),
+    )
+
+    assert result is agent
+    assert agent.status == "paused"
+    assert provisioned == []
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_config_update_still_provisions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """heartbeat_config is pushed into the gateway config, so it must re-provision."""
+    agent = SimpleNamespace(id=uuid4(), status="active", heartbeat_config=None)
+    service, provisioned = _prepare_service(monkeypatch, agent)
+
+    await service.update_agent(
+        agent_id=str(agent.id),
+        payload=AgentUpdate.model_validate({"heartbeat_config": {"every": "10m"}}),
+        options=_options(),
+    )
+
+    assert agent.heartbeat_config == {"every": "10m"}
+    assert len(provisioned) == 1
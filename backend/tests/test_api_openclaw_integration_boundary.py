@@ -3,50 +3,67 @@
 
 from __future__ import annotations
 
-import re
+import ast
 from pathlib import Path
+from typing import Callable
 
+import pytest
 
-def test_api_does_not_import_openclaw_gateway_client_directly() -> None:
-    """API modules should use OpenClaw services, not integration client imports."""
-    repo_root = Path(__file__).resolve().parents[2]
-    api_root = repo_root / "backend" / "app" / "api"
+_GATEWAY_MODULE = "app.integrations.openclaw_gateway"
+_RPC_MODULE = "app.services.openclaw.gateway_rpc"
+_FORBIDDEN_RPC_NAMES = frozenset({"ensure_session", "send_message", "openclaw_call"})
 
-    violations: list[str] = []
-    for path in api_root.rglob("*.py"):
-        rel = path.relative_to(repo_root)
-        for lineno, raw_line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-            line = raw_line.strip()
-            if line.startswith("from app.integrations.openclaw_gateway import "):
-                violations.append(f"{rel}:{lineno}")
-            elif line.startswith("import app.integrations.openclaw_gateway"):
-                violations.append(f"{rel}:{lineno}")
 
-    assert not violations, (
-        "Import OpenClaw integration details via service modules (for example "
-        "`app.services.openclaw.shared`) instead of directly from `app.api`. "
-        f"Violations: {', '.join(violations)}"
+def _imports_gateway_client(node: ast.Import | ast.ImportFrom) -> bool:
+    """Any import of the gateway client package or its submodules."""
+    if isinstance(node, ast.ImportFrom):
+        module = node.module or ""
+        return module == _GATEWAY_MODULE or module.startswith(f"{_GATEWAY_MODULE}.")
+    return any(
+        alias.name == _GATEWAY_MODULE or alias.name.startswith(f"{_GATEWAY_MODULE}.")
+        for alias in node.names
     )
 
 
-def test_api_uses_safe_gateway_dispatch_helper() -> None:
-    """API modules should not call low-level gateway RPC helpers directly."""
-    repo_root = Path(__file__).resolve().parents[2]
-    api_root = repo_root / "backend" / "app" / "api"
-
-    forbidden = {"ensure_session", "send_message", "openclaw_call"}
-    violations: list[str] = []
-    for path in api_root.rglob("*.py"):
-        rel = path.relative_to(repo_root)
-        for lineno, raw_line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-            line = raw_line.strip()
-            if not line.startswith("from app.services.openclaw.gateway_rpc import "):
-                continue
-            if any(re.search(rf"\\b{name}\\b", line) for name in forbidden):
-                violations.append(f"{rel}:{lineno}")
-
-    assert not violations, (
-        "Use OpenClaw service modules (for example `app.services.openclaw.gateway_dispatch`) "
-        "instead of calling low-level gateway RPC helpers from `app.api`."
-        f"Violations: {', '.join(violations)}"
+def _imports_low_level_rpc(node: ast.Import | ast.ImportFrom) -> bool:
+    """`from app.services.openclaw.gateway_rpc import <forbidden helper>`."""
+    return (
+        isinstance(node, ast.ImportFrom)
+        and node.module == _RPC_MODULE
+        and any(alias.name in _FORBIDDEN_RPC_NAMES for alias in node.names)
     )
+
+
+# Each rule is (violation predicate over an import node, error message).
+_BOUNDARY_RULES = [
+    pytest.param(
+        _imports_gateway_client,
+        "Import OpenClaw integration details via service modules (for example "
+        "`app.services.openclaw.shared`) instead of directly from `app.api`. ",
+        id="no-direct-gateway-client-imports",
+    ),
+    pytest.param(
+        _imports_low_level_rpc,
+        "Use OpenClaw service modules (for example "
+        "`app.services.openclaw.gateway_dispatch`) instead of calling low-level "
+        "gateway RPC helpers from `app.api`. ",
+        id="no-low-level-rpc-helpers",
+    ),
+]
+
+
+@pytest.mark.parametrize(("is_violation", "message"), _BOUNDARY_RULES)
+def test_api_gateway_import_boundaries(
+    api_py_imports: list[tuple[Path, list[ast.Import | ast.ImportFrom]]],
+    is_violation: Callable[[ast.Import | ast.ImportFrom], bool],
+    message: str,
+) -> None:
+    """API modules should use OpenClaw services, not low-level gateway imports."""
+    violations = [
+        f"{rel}:{node.lineno}"
+        for rel, imports in api_py_imports
+        for node in imports
+        if is_violation(node)
+    ]
+
+    assert not violations, f"{message}Violations: {', '.join(violations)}"
@@ -142,3 +142,24 @@ async def test_delete_where_rolls_back_when_commit_fails() -> None:
 
     assert session.exec_calls == 1
     assert session.rollback_calls == 1
+
+
+def _integrity_error(driver_message: object) -> Any:
+    from sqlalchemy.exc import IntegrityError
+
+    exc = IntegrityError("INSERT INTO _test_thing ...", {}, Exception())
+    exc.orig = SimpleNamespace(args=(driver_message,))
+    return exc
+
+
+def test_is_unique_violation_matches_driver_messages() -> None:
+    sqlite_exc = _integrity_error("UNIQUE constraint failed: tags.organization_id, tags.slug")
+    postgres_exc = _integrity_error(
+        'duplicate key value violates unique constraint "uq_tags_organization_id_slug"'
+    )
+    fk_exc = _integrity_error("FOREIGN KEY constraint failed")
+
+    assert crud.is_unique_violation(sqlite_exc)
+    assert crud.is_unique_violation(postgres_exc)
+    assert not crud.is_unique_violation(fk_exc)
+    assert not crud.is_unique_violation(_integrity_error(None))
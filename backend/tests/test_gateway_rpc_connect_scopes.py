@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 import app.services.openclaw.gateway_rpc as gateway_rpc
@@ -192,3 +194,43 @@ async def test_openclaw_call_surfaces_scope_error_without_device_fallback(
             "status",
             config=GatewayConfig(url="ws://gateway.example/ws", token="secret-token"),
         )
+
+
+class _FakeWs:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_acquire_pooled_connection_closes_loser_on_cold_start_race(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Two concurrent cold-pool acquisitions share one connection; the duplicate closes."""
+    opened: list[_FakeWs] = []
+
+    async def _fake_open(config: GatewayConfig, gateway_url: str) -> _FakeWs:
+        del config, gateway_url
+        # Yield so both coroutines pass the empty-pool check before either
+        # installs its connection.
+        await asyncio.sleep(0)
+        ws = _FakeWs()
+        opened.append(ws)
+        return ws
+
+    monkeypatch.setattr(gateway_rpc, "_open_authenticated_connection", _fake_open)
+    monkeypatch.setattr(gateway_rpc, "_connection_pool", {})
+    config = GatewayConfig(url="ws://gateway.example/ws")
+
+    first, second = await asyncio.gather(
+        gateway_rpc._acquire_pooled_connection(config, config.url),
+        gateway_rpc._acquire_pooled_connection(config, config.url),
+    )
+
+    assert first is second
+    assert len(opened) == 2
+    assert len(gateway_rpc._connection_pool) == 1
+    assert first.ws.closed is False
+    assert sum(ws.closed for ws in opened) == 1
@@ -0,0 +1,35 @@
+# ruff: noqa: S101
+"""Architectural boundary test keeping gateway reads free of reconciliation."""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+_READ_HANDLERS = {"list_gateways", "get_gateway"}
+_RECONCILE_CALLS = {"ensure_gateway_agents_exist", "ensure_main_agent"}
+
+
+def test_gateway_read_handlers_do_not_reconcile() -> None:
+    """GET /gateways handlers must stay pure reads; reconciliation belongs to writes."""
+    repo_root = Path(__file__).resolve().parents[2]
+    module_path = repo_root / "backend" / "app" / "api" / "gateways.py"
+    tree = ast.parse(module_path.read_text(encoding="utf-8"))
+
+    violations: list[str] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.AsyncFunctionDef) or node.name not in _READ_HANDLERS:
+            continue
+        for call in ast.walk(node):
+            if not isinstance(call, ast.Call):
+                continue
+            func = call.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+            if name in _RECONCILE_CALLS:
+                violations.append(f"{node.name}:{call.lineno}")
+
+    assert not violations, (
+        "Gateway read handlers must not run main-agent reconciliation inline; "
+        "trigger it from write endpoints or template sync instead. "
+        f"Violations: {', '.join(violations)}"
+    )
@@ -26,14 +26,20 @@ class _FakeRedis:
         return self.values.pop()
 
 
-@pytest.mark.parametrize("attempts", [0, 1, 2])
-def test_generic_queue_roundtrip(monkeypatch: pytest.MonkeyPatch, attempts: int) -> None:
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    """Install one `_FakeRedis` behind the queue's client factory."""
     fake = _FakeRedis()
 
     def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
         return fake
 
     monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    return fake
+
+
+@pytest.mark.parametrize("attempts", [0, 1, 2])
+def test_generic_queue_roundtrip(fake_redis: _FakeRedis, attempts: int) -> None:
     payload = QueuedTask(
         task_type="generic-task",
         payload={"name": "webhook.delivery"},
@@ -50,13 +56,7 @@ def test_generic_queue_roundtrip(monkeypatch: pytest.MonkeyPatch, attempts: int)
 
 
 @pytest.mark.parametrize("attempts", [0, 1, 2, 3])
-def test_generic_requeue_respects_retry_cap(monkeypatch: pytest.MonkeyPatch, attempts: int) -> None:
-    fake = _FakeRedis()
-
-    def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
-        return fake
-
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+def test_generic_requeue_respects_retry_cap(fake_redis: _FakeRedis, attempts: int) -> None:
     payload = QueuedTask(
         task_type="generic-task",
         payload={"attempt": attempts},
@@ -66,7 +66,7 @@ def test_generic_requeue_respects_retry_cap(monkeypatch: pytest.MonkeyPatch, att
 
     if attempts >= 3:
         assert requeue_if_failed(payload, "generic-queue", max_retries=3) is False
-        assert fake.values == []
+        assert fake_redis.values == []
     else:
         assert requeue_if_failed(payload, "generic-queue", max_retries=3) is True
         requeued = dequeue_task("generic-queue")
@@ -75,16 +75,10 @@ def test_generic_requeue_respects_retry_cap(monkeypatch: pytest.MonkeyPatch, att
 
 
 def test_dequeue_task_tolerates_legacy_payload_without_envelope(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_redis: _FakeRedis,
 ) -> None:
-    fake = _FakeRedis()
-
-    def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
-        return fake
-
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
     created_at = datetime.now(UTC)
-    fake.values.append(
+    fake_redis.values.append(
         json.dumps(
             {
                 "board_id": "6f3ab1ec-3ef6-4f4d-a6a7-e2d6e5d6f7a8",
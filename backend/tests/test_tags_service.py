@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from uuid import uuid4
 
@@ -13,19 +14,26 @@ from app.services import tags
 
 @dataclass
 class _FakeSession:
-    exec_results: list[object]
+    exec_results: deque[object]
     executed: list[object] = field(default_factory=list)
     added: list[object] = field(default_factory=list)
 
+    def __post_init__(self):
+        # popleft is O(1); list.pop(0) shifts the remaining results each call.
+        self.exec_results = deque(self.exec_results)
+
     async def exec(self, query):
         self.executed.append(query)
         if not self.exec_results:
             raise AssertionError("No more exec_results left for session.exec")
-        return self.exec_results.pop(0)
+        return self.exec_results.popleft()
 
     def add(self, value):
         self.added.append(value)
 
+    def add_all(self, values):
+        self.added.extend(values)
+
 
 def test_slugify_tag_normalizes_text():
     assert tags.slugify_tag("Release / QA") == "release-qa"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from uuid import UUID, uuid4
 
@@ -36,39 +37,45 @@ def test_blocked_by_dependency_ids_flags_not_done_and_missing_status():
     ) == [b, c]
 
 
-@pytest.mark.parametrize(
-    ("nodes", "edges", "expected"),
-    [
-        # A -> B -> C (acyclic)
-        (
-            [UUID(int=1), UUID(int=2), UUID(int=3)],
-            {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}},
-            False,
-        ),
-        # A -> B -> C -> A (cycle)
-        (
-            [UUID(int=1), UUID(int=2), UUID(int=3)],
-            {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}, UUID(int=3): {UUID(int=1)}},
-            True,
-        ),
-        # Self-loop (cycle)
-        (
-            [UUID(int=1)],
-            {UUID(int=1): {UUID(int=1)}},
-            True,
-        ),
-    ],
+# Module-level table with explicit ids: short test ids instead of pytest
+# repr'ing the nested UUID dicts at collection time.
+_CYCLE_CASES = (
+    pytest.param(
+        [UUID(int=1), UUID(int=2), UUID(int=3)],
+        {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}},
+        False,
+        id="chain-acyclic",
+    ),
+    pytest.param(
+        [UUID(int=1), UUID(int=2), UUID(int=3)],
+        {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}, UUID(int=3): {UUID(int=1)}},
+        True,
+        id="three-node-cycle",
+    ),
+    pytest.param(
+        [UUID(int=1)],
+        {UUID(int=1): {UUID(int=1)}},
+        True,
+        id="self-loop",
+    ),
 )
+
+
+@pytest.mark.parametrize(("nodes", "edges", "expected"), _CYCLE_CASES)
 def test_has_cycle(nodes, edges, expected):
     assert task_dependencies._has_cycle(nodes, edges) is expected
 
 
 @dataclass
 class _FakeSession:
-    exec_results: list[object]
+    exec_results: deque[object]
     executed: list[object] = field(default_factory=list)
     added: list[object] = field(default_factory=list)
 
+    def __post_init__(self):
+        # popleft is O(1); list.pop(0) shifts the remaining results each call.
+        self.exec_results = deque(self.exec_results)
+
     async def exec(self, _query):
         is_dml = _query.__class__.__name__ in {"Delete", "Update", "Insert"}
         if is_dml:
@@ -76,7 +83,7 @@ class _FakeSession:
             return None
         if not self.exec_results:
             raise AssertionError("No more exec_results left for session.exec")
-        return self.exec_results.pop(0)
+        return self.exec_results.popleft()
 
     async def execute(self, statement):
         self.executed.append(statement)
@@ -84,6 +91,9 @@ class _FakeSession:
     def add(self, value):
         self.added.append(value)
 
+    def add_all(self, values):
+        self.added.extend(values)
+
 
 @pytest.mark.asyncio
 async def test_dependency_ids_by_task_id_empty_short_circuit():
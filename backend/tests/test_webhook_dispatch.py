@@ -32,13 +32,20 @@ class _FakeRedis:
         return self.values.pop()
 
 
-@pytest.mark.parametrize("attempts", [0, 1, 2])
-def test_webhook_queue_roundtrip(monkeypatch: pytest.MonkeyPatch, attempts: int) -> None:
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    """Install one `_FakeRedis` behind the queue's client factory."""
     fake = _FakeRedis()
 
     def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
         return fake
 
+    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    return fake
+
+
+@pytest.mark.parametrize("attempts", [0, 1, 2])
+def test_webhook_queue_roundtrip(fake_redis: _FakeRedis, attempts: int) -> None:
     board_id = uuid4()
     webhook_id = uuid4()
     payload_id = uuid4()
@@ -50,7 +57,6 @@ def test_webhook_queue_roundtrip(monkeypatch: pytest.MonkeyPatch, attempts: int)
         attempts=attempts,
     )
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
     assert enqueue_webhook_delivery(payload)
 
     dequeued = dequeue_webhook_delivery()
@@ -61,17 +67,12 @@ def test_webhook_queue_roundtrip(monkeypatch: pytest.MonkeyPatch, attempts: int)
     assert dequeued.attempts == attempts
 
 
-def test_webhook_queue_dequeue_legacy_payload(monkeypatch: pytest.MonkeyPatch) -> None:
-    fake = _FakeRedis()
-
-    def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
-        return fake
-
+def test_webhook_queue_dequeue_legacy_payload(fake_redis: _FakeRedis) -> None:
     payload_id = uuid4()
     board_id = uuid4()
     webhook_id = uuid4()
     received_at = datetime.now(UTC)
-    fake.values.append(
+    fake_redis.values.append(
         json.dumps(
             {
                 "board_id": str(board_id),
@@ -83,7 +84,6 @@ def test_webhook_queue_dequeue_legacy_payload(monkeypatch: pytest.MonkeyPatch) -
         )
     )
 
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
     dequeued = dequeue_webhook_delivery()
 
     assert dequeued is not None
@@ -94,14 +94,7 @@ def test_webhook_queue_dequeue_legacy_payload(monkeypatch: pytest.MonkeyPatch) -
 
 
 @pytest.mark.parametrize("attempts", [0, 1, 2, 3])
-def test_requeue_respects_retry_cap(monkeypatch: pytest.MonkeyPatch, attempts: int) -> None:
-    fake = _FakeRedis()
-
-    def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
-        return fake
-
-    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
-
+def test_requeue_respects_retry_cap(fake_redis: _FakeRedis, attempts: int) -> None:
     payload = QueuedInboundDelivery(
         board_id=uuid4(),
         webhook_id=uuid4(),
@@ -112,7 +105,7 @@ def test_requeue_respects_retry_cap(monkeypatch: pytest.MonkeyPatch, attempts: i
 
     if attempts >= 3:
         assert requeue_if_failed(payload) is False
-        assert fake.values == []
+        assert fake_redis.values == []
     else:
         assert requeue_if_failed(payload) is True
         requeued = dequeue_webhook_delivery()